@@ -18,6 +18,9 @@ from pathlib import Path
 from datetime import datetime
 import time
 
+session = requests.Session()
+session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+
 # Paths
 SEC_JSON_PATH = Path('/Users/sagiv.oron/Documents/scripts_playground/stocks/info/all_SEC_filing_companies.json')
 OUTPUT_JSON = Path('/Users/sagiv.oron/Documents/scripts_playground/stocks/output CSVs/expanded_insider_trades.json')
@@ -36,11 +39,7 @@ def quick_check_has_purchases(ticker):
             'page': '1'
         }
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response = session.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -84,11 +83,7 @@ def fetch_insider_trades_for_ticker(ticker):
             'page': '1'
         }
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, params=params, headers=headers, timeout=15)
+        response = session.get(url, params=params, timeout=15)
         
         if response.status_code != 200:
             return None
@@ -12,6 +12,9 @@ from datetime import datetime
 from multiprocessing import Pool, cpu_count
 from threading import Lock
 
+session = requests.Session()
+session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+
 # Global progress tracking
 counter = 0
 counter_lock = Lock()
@@ -30,11 +33,7 @@ def quick_check_has_purchases(ticker):
             'cnt': '10'
         }
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response = session.get(url, params=params, timeout=10)
         
         result = None
         if response.status_code == 200:
@@ -88,11 +87,7 @@ def fetch_insider_trades_for_ticker(ticker):
             'page': '1'
         }
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, params=params, headers=headers, timeout=15)
+        response = session.get(url, params=params, timeout=15)
         
         if response.status_code != 200:
             with counter_lock:
@@ -35,7 +35,12 @@ COLORS = {
 
 def load_backtest_results(csv_path):
     """Load backtest results from CSV and normalize columns"""
-    df = pd.read_csv(csv_path)
+    return normalize_backtest_results(pd.read_csv(csv_path))
+
+
+def normalize_backtest_results(df):
+    """Normalize backtest result columns (works on a CSV load or an in-memory DataFrame)"""
+    df = df.copy()
     
     # Normalize column names across different backtest strategies
     # Some strategies use different column names, so we standardize them
@@ -345,14 +350,18 @@ def create_summary_page(pdf, all_trades):
     plt.close(fig)
 
 
-def generate_pdf_report(backtest_csv, monthly_json, output_pdf, period='1y'):
-    """Generate the full PDF report"""
+def generate_pdf_report(backtest_csv, monthly_json, output_pdf, period='1y', backtest_df=None):
+    """Generate the full PDF report (pass backtest_df to skip re-reading backtest_csv)"""
     
     print("🎨 Starting PDF generation...")
     print("=" * 80)
     
     # Load data
-    backtest_df = load_backtest_results(backtest_csv)
+    if backtest_df is not None:
+        backtest_df = normalize_backtest_results(backtest_df)
+        print(f"📊 Using {len(backtest_df)} trades from in-memory backtest results")
+    else:
+        backtest_df = load_backtest_results(backtest_csv)
     monthly_stocks = load_monthly_trades(monthly_json)
     
     # Get unique tickers from backtest
@@ -419,46 +428,40 @@ def generate_pdf_report(backtest_csv, monthly_json, output_pdf, period='1y'):
     print("=" * 80)
 
 
-if __name__ == '__main__':
-    import argparse
-    
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description='Generate PDF report from backtest results')
-    parser.add_argument('--strategy', type=str, default='card_counting',
-                       choices=['card_counting', 'smart_strategy', 'trailing_stop', 'peak_purchase', 'simple'],
-                       help='Which backtest strategy results to visualize')
-    parser.add_argument('--period', type=str, default='1y',
-                       choices=['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', 'max'],
-                       help='Time period for stock charts')
-    args = parser.parse_args()
-    
-    # Map strategy names to file names
-    strategy_files = {
-        'card_counting': 'backtest_card_counting_results.csv',
-        'smart_strategy': 'backtest_smart_strategy_results.csv',
-        'trailing_stop': 'backtest_trailing_stop_results.csv',
-        'peak_purchase': 'backtest_results.csv',  # Original backtest
-        'simple': 'backtest_simple_results.csv'  # Simple strategy
-    }
-    
+# Map strategy names to file names
+STRATEGY_FILES = {
+    'card_counting': 'backtest_card_counting_results.csv',
+    'smart_strategy': 'backtest_smart_strategy_results.csv',
+    'trailing_stop': 'backtest_trailing_stop_results.csv',
+    'peak_purchase': 'backtest_results.csv',  # Original backtest
+    'simple': 'backtest_simple_results.csv'  # Simple strategy
+}
+
+
+def main(strategy='card_counting', period='1y', df=None):
+    """
+    Generate the PDF report for a strategy. Backtest scripts can import this and
+    pass their results DataFrame as df to skip the CSV round trip and a new
+    Python process.
+    """
     # File paths
     base_dir = Path('/Users/sagiv.oron/Documents/scripts_playground/stocks')
-    backtest_csv = base_dir / 'output CSVs' / strategy_files[args.strategy]
+    backtest_csv = base_dir / 'output CSVs' / STRATEGY_FILES[strategy]
     monthly_json = base_dir / 'output CSVs' / 'top_monthly_insider_trades.json'
-    output_pdf = base_dir / 'output CSVs' / f'backtest_{args.strategy}_visual_report.pdf'
+    output_pdf = base_dir / 'output CSVs' / f'backtest_{strategy}_visual_report.pdf'
     
     # Check if files exist
-    if not backtest_csv.exists():
+    if df is None and not backtest_csv.exists():
         print(f"❌ Error: Backtest CSV not found at {backtest_csv}")
-        print(f"💡 Run the backtest first: python scripts/tests/backtest_{args.strategy}_strategy.py")
+        print(f"💡 Run the backtest first: python scripts/tests/backtest_{strategy}_strategy.py")
         sys.exit(1)
     
     if not monthly_json.exists():
         print(f"❌ Error: Monthly trades JSON not found at {monthly_json}")
         sys.exit(1)
     
-    print(f"🎯 Generating PDF for strategy: {args.strategy.upper()}")
-    print(f"📊 Period: {args.period}")
+    print(f"🎯 Generating PDF for strategy: {strategy.upper()}")
+    print(f"📊 Period: {period}")
     print()
     
     # Generate report
@@ -466,5 +469,22 @@ if __name__ == '__main__':
         backtest_csv=str(backtest_csv),
         monthly_json=str(monthly_json),
         output_pdf=str(output_pdf),
-        period=args.period
+        period=period,
+        backtest_df=df
     )
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='Generate PDF report from backtest results')
+    parser.add_argument('--strategy', type=str, default='card_counting',
+                       choices=list(STRATEGY_FILES),
+                       help='Which backtest strategy results to visualize')
+    parser.add_argument('--period', type=str, default='1y',
+                       choices=['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', 'max'],
+                       help='Time period for stock charts')
+    args = parser.parse_args()
+    
+    main(strategy=args.strategy, period=args.period)
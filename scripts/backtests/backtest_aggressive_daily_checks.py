@@ -435,12 +435,11 @@ if __name__ == '__main__':
         import csv
         output_file = '/Users/sagiv.oron/Documents/scripts_playground/stocks/output CSVs/backtest_aggressive_daily_results.csv'
         
-        all_fields = set()
-        for result in results:
-            all_fields.update(result.keys())
+        # Get all possible field names
+        fieldnames = sorted({key for result in results for key in result})
         
         with open(output_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=sorted(all_fields))
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
             writer.writeheader()
             writer.writerows(results)
         
@@ -56,7 +56,7 @@ def load_cache_data():
             'Low': ticker_data['low'],
             'Close': ticker_data['close'],
             'Volume': ticker_data['volume']
-        }, index=pd.to_datetime(ticker_data['dates']))
+        }, index=pd.to_datetime(ticker_data['dates'], format='%Y-%m-%d'))
         
         price_cache[ticker] = df
     
@@ -640,12 +640,10 @@ if __name__ == '__main__':
         output_file = '/Users/sagiv.oron/Documents/scripts_playground/stocks/output CSVs/backtest_card_counting_results.csv'
         
         # Get all possible field names
-        all_fields = set()
-        for result in results:
-            all_fields.update(result.keys())
+        fieldnames = sorted({key for result in results for key in result})
         
         with open(output_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=sorted(all_fields))
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
             writer.writeheader()
             writer.writerows(results)
         
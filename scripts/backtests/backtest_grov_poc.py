@@ -5,8 +5,15 @@ Outputs JSON for webapp display.
 """
 
 import json
+import sys
+import ijson
 import pandas as pd
 from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'utils'))
+from paths import NaNToNullReader, full_cache_source, open_full_cache
+from file_cache import FileCache
 
 def identify_rise_events(df, min_days=4, min_growth_pct=2.0, min_decline_pct=1.5, min_recovery_pct=2.0):
     """Identify rise events."""
@@ -97,35 +104,44 @@ def identify_rise_events(df, min_days=4, min_growth_pct=2.0, min_decline_pct=1.5
     
     return rise_events
 
-# Load GROV data from cache
-print("Loading GROV data...")
-with open('output CSVs/yfinance_cache_full.json', 'r') as f:
-    cache = json.load(f)
+def load_grov_rise_events():
+    """Load GROV prices from the full cache and identify its rise events."""
+    # Stream only the GROV subtree - other tickers are scanned past without being built
+    with open_full_cache() as f:
+        grov_data = next(ijson.items(NaNToNullReader(f), 'data.GROV', use_float=True), None)
+    
+    if not grov_data:
+        return None
+    
+    # Build DataFrame
+    df = pd.DataFrame({
+        'Open': grov_data['open'],
+        'High': grov_data['high'],
+        'Low': grov_data['low'],
+        'Close': grov_data['close'],
+        'Volume': grov_data['volume']
+    }, index=pd.to_datetime(grov_data['dates'], format='%Y-%m-%d'))
+    
+    return {
+        'days': len(df),
+        'first_date': df.index[0].date(),
+        'last_date': df.index[-1].date(),
+        'rise_events': identify_rise_events(df)
+    }
 
-# Find GROV in cache
-grov_data = None
-for ticker, data in cache['data'].items():
-    if ticker == 'GROV':
-        grov_data = data
-        break
+# Load GROV data from cache - the parse + event detection is reused until yfinance_cache_full.json changes
+print("Loading GROV data...")
+file_cache = FileCache()
+grov = file_cache.get_or_compute(FileCache.key_for('grov_rise_events', full_cache_source()), load_grov_rise_events)
 
-if not grov_data:
+if not grov:
     print("GROV not found in cache!")
     exit(1)
 
-# Build DataFrame
-df = pd.DataFrame({
-    'Open': grov_data['open'],
-    'High': grov_data['high'],
-    'Low': grov_data['low'],
-    'Close': grov_data['close'],
-    'Volume': grov_data['volume']
-}, index=pd.to_datetime(grov_data['dates']))
-
-print(f"GROV data: {len(df)} days from {df.index[0].date()} to {df.index[-1].date()}")
+print(f"GROV data: {grov['days']} days from {grov['first_date']} to {grov['last_date']}")
 
 # Get rise events
-rise_events = identify_rise_events(df)
+rise_events = grov['rise_events']
 print(f"Found {len(rise_events)} rise events")
 
 # Create a trade for EVERY rise event (simulate entering at start, exiting at end)
@@ -735,12 +735,14 @@ def generate_event_files(events: List[Dict], price_df: pd.DataFrame, ticker: str
         print("⚠️ No events to export")
         return
     
-    # Look up actual end prices for RISE events (FALL events already have end_price)
+    # Look up actual end prices for RISE events (FALL events already have end_price).
+    # Position lookup into the raw Close array skips the per-event row Series that .loc[date] builds
+    closes = price_df['Close'].to_numpy()
     for event in events:
         if event['end_price'] is None:
             try:
                 end_date = event['end_date']
-                end_price = price_df.loc[end_date]['Close']
+                end_price = closes[price_df.index.get_loc(end_date)]
                 event['end_price'] = end_price
             except:
                 # Fallback: use peak price if date not found
@@ -1134,7 +1136,7 @@ def main():
             'Low': ticker_data['low'],
             'Close': ticker_data['close'],
             'Volume': ticker_data['volume']
-        }, index=pd.to_datetime(ticker_data['dates']))
+        }, index=pd.to_datetime(ticker_data['dates'], format='%Y-%m-%d'))
         price_cache[ticker] = df
     
     # Load all insider trades
@@ -60,7 +60,7 @@ def load_cache_data():
             'Low': ticker_data['low'],
             'Close': ticker_data['close'],
             'Volume': ticker_data['volume']
-        }, index=pd.to_datetime(ticker_data['dates']))
+        }, index=pd.to_datetime(ticker_data['dates'], format='%Y-%m-%d'))
         
         price_cache[ticker] = df
     
@@ -80,6 +80,7 @@ class RiseFallDetector:
         """
         self.history = history.copy()
         self.events = []
+        self.event_intervals = pd.IntervalIndex.from_arrays(pd.DatetimeIndex([]), pd.DatetimeIndex([]), closed='both')
         
     def detect_events(self, min_days=2):
         """
@@ -160,6 +161,12 @@ class RiseFallDetector:
                 })
         
         self.events = events
+        # Events are sorted and non-overlapping, so date lookups can binary search this index
+        self.event_intervals = pd.IntervalIndex.from_arrays(
+            pd.DatetimeIndex([e['start_date'] for e in events]),
+            pd.DatetimeIndex([e['end_date'] for e in events]),
+            closed='both'
+        )
         return events
     
     def get_event_at_date(self, target_date):
@@ -174,11 +181,10 @@ class RiseFallDetector:
         """
         target = pd.Timestamp(target_date)
         
-        for event in self.events:
-            if event['start_date'] <= target <= event['end_date']:
-                return event
-        
-        return None
+        try:
+            return self.events[self.event_intervals.get_loc(target)]
+        except KeyError:
+            return None
     
     def get_next_event(self, target_date, event_type=None):
         """
@@ -192,18 +198,18 @@ class RiseFallDetector:
             Event dict or None
         """
         target = pd.Timestamp(target_date)
+        first_after = self.event_intervals.left.searchsorted(target, side='right')
         
-        for event in self.events:
-            if event['start_date'] > target:
-                if event_type is None or event['type'] == event_type:
-                    return event
+        for event in self.events[first_after:]:
+            if event_type is None or event['type'] == event_type:
+                return event
         
         return None
     
     def get_events_after_date(self, target_date, max_events=10):
         """Get list of events after a date"""
-        target = pd.Timestamp(target_date)
-        return [e for e in self.events if e['start_date'] > target][:max_events]
+        first_after = self.event_intervals.left.searchsorted(pd.Timestamp(target_date), side='right')
+        return self.events[first_after:first_after + max_events]
 
 # ===== HELPER FUNCTIONS =====
 
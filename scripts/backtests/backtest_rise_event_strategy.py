@@ -207,7 +207,9 @@ def backtest_rise_event_strategy():
         df = pd.DataFrame(price_data)
         df['Date'] = pd.to_datetime(df['Date'])
         df.set_index('Date', inplace=True)
-        df.sort_index(inplace=True)
+        # yfinance history is cached in date order - checking that is O(n), re-sorting is O(n log n)
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
         
         if df.empty:
             debug_counters['empty_df'] += 1
@@ -11,7 +11,9 @@ Rules:
 6. Track each insider purchase separately
 """
 
+import numpy as np
 import pandas as pd
+from numba import njit
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List
@@ -119,21 +121,27 @@ def identify_rise_fall_events(df: pd.DataFrame, min_days: int = 4, min_growth_pc
     
     return events
 
-def is_explosion(rise_pct: float, all_rises_so_far: List[float]) -> bool:
-    """Check if this rise is an explosion (top 25% of all rises so far)."""
-    if not all_rises_so_far:
-        return False
-    
-    # Need at least 2 rises to determine if something is top tier
-    if len(all_rises_so_far) < 2:
-        return False
-    
-    # Top 25% threshold
-    sorted_rises = sorted(all_rises_so_far, reverse=True)
-    top_25_idx = max(1, len(sorted_rises) // 4)
-    threshold = sorted_rises[top_25_idx - 1]
+@njit(cache=True)
+def explosion_thresholds(growth: np.ndarray) -> np.ndarray:
+    """
+    Top-25% cutoff for each rise, based on all rises before it (rise k is an explosion if pct >= thresholds[k]).
+    growth is the float64 array of rise pcts in date order.
+    """
+    n = len(growth)
+    # Need at least 2 rises to determine if something is top tier - inf can never be reached
+    thresholds = np.full(n, np.inf)
+    seen = np.empty(n)  # seen[:k] holds the first k rises, kept sorted by insertion
+    for k in range(n):
+        if k >= 2:
+            # The max(1, k // 4)-th largest of the first k rises
+            thresholds[k] = seen[k - max(1, k // 4)]
+        
+        pos = np.searchsorted(seen[:k], growth[k])
+        for j in range(k, pos, -1):
+            seen[j] = seen[j - 1]
+        seen[pos] = growth[k]
     
-    return rise_pct >= threshold
+    return thresholds
 
 def backtest():
     """Run the rise explosion strategy."""
@@ -185,7 +193,9 @@ def backtest():
         df = pd.DataFrame(price_data)
         df['Date'] = pd.to_datetime(df['Date'])
         df.set_index('Date', inplace=True)
-        df.sort_index(inplace=True)
+        # yfinance history is cached in date order - checking that is O(n), re-sorting is O(n log n)
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
         
         if df.empty or len(df) < 10:
             continue
@@ -199,92 +209,82 @@ def backtest():
         if not rise_events:
             continue
         
-        # Track all rise percentages for explosion detection
-        all_rise_pcts = [event['pct'] for event in rise_events]
+        # Rises as typed columns rather than a list of dicts, so the per-purchase lookups below are
+        # binary searches and the returns one vector op. Rises never overlap, so both date columns are sorted
+        rises = pd.DataFrame(rise_events)
+        n_rises = len(rises)
+        start_dates = pd.DatetimeIndex(rises['start_date'])
+        end_dates = pd.DatetimeIndex(rises['end_date'])
+        start_days = start_dates.normalize()
+        end_days = end_dates.normalize()
+        start_prices = rises['start_price'].to_numpy(dtype=np.float64)
+        end_prices = rises['end_price'].to_numpy(dtype=np.float64)
+        close_prices = df['Close'].to_numpy(dtype=np.float64)
         
-        # Process each insider purchase
-        for purchase in purchases:
-            insider_date = purchase['date']
+        # Explosion cutoffs only depend on the rises before each event, so compute them once per ticker.
+        # next_explosion[k] is the first explosive rise at or after rise k (n_rises if there is none)
+        rise_pcts = rises['pct'].to_numpy(dtype=np.float64)
+        is_explosion = rise_pcts >= explosion_thresholds(rise_pcts)
+        next_explosion = np.where(is_explosion, np.arange(n_rises), n_rises)
+        next_explosion = np.append(np.minimum.accumulate(next_explosion[::-1])[::-1], n_rises)
+        
+        # Skip purchases before the IPO wait period, then look all the rest up at once: the first rise
+        # ending on/after each purchase day, and the first trading day at/after each purchase
+        purchases = [purchase for purchase in purchases if purchase['date'] >= ipo_plus_3_months]
+        purchase_dates = pd.DatetimeIndex([purchase['date'] for purchase in purchases])
+        purchase_days = purchase_dates.normalize()
+        first_rises = end_days.searchsorted(purchase_days, side='left')
+        buy_positions = df.index.searchsorted(purchase_dates, side='left')
+        
+        # (purchase index, rise index, buy date, buy price) for every trade, in purchase then rise order
+        trades = []
+        for purchase_idx, event_idx in enumerate(first_rises):
+            if event_idx < n_rises and start_days[event_idx] <= purchase_days[purchase_idx]:
+                # Insider bought DURING this rise - enter at the first close on or after the insider date
+                buy_pos = buy_positions[purchase_idx]
+                if buy_pos < len(df) and df.index[buy_pos] <= end_dates[event_idx]:
+                    trades.append((purchase_idx, event_idx, df.index[buy_pos], close_prices[buy_pos]))
+                    if is_explosion[event_idx]:
+                        continue
+                event_idx += 1
             
-            # Skip if before IPO wait period
-            if insider_date < ipo_plus_3_months:
-                continue
+            # Insider bought before every later rise - enter at its start, until the first explosion
+            for later_idx in range(event_idx, min(next_explosion[event_idx] + 1, n_rises)):
+                trades.append((purchase_idx, later_idx, start_dates[later_idx], start_prices[later_idx]))
+        
+        # Exit at end of rise - returns for all of this ticker's trades in one pass
+        trade_rises = np.array([trade[1] for trade in trades], dtype=np.int64)
+        buy_prices = np.array([trade[3] for trade in trades], dtype=np.float64)
+        return_pcts = ((end_prices[trade_rises] - buy_prices) / buy_prices) * 100
+        
+        c_level_titles = ['CEO', 'CFO', 'COO', 'CTO', 'President', 'Chief', 'Vice Chair']
+        for (purchase_idx, event_idx, buy_date, buy_price), return_pct in zip(trades, return_pcts):
+            purchase = purchases[purchase_idx]
+            sell_date = end_dates[event_idx]
+            sell_price = end_prices[event_idx]
             
-            # Find which events this insider purchase affects
-            explosion_found = False
-            rises_seen_so_far = []
+            # Position size
+            insider_info = f"{purchase['insider']} {purchase['title']}"
+            is_c_level = any(title in insider_info for title in c_level_titles)
+            position_size = 4000 if is_c_level else 2000
+            profit_loss = position_size * (return_pct / 100)
             
-            for event in rise_events:
-                event_start = event['start_date']
-                event_end = event['end_date']
-                
-                # Only consider events on or after insider purchase
-                if event_end.date() < insider_date.date():
-                    # This rise happened before insider purchase, add to history
-                    rises_seen_so_far.append(event['pct'])
-                    continue
-                
-                if explosion_found:
-                    # Already got explosion for this insider, skip rest
-                    break
-                
-                # Insider bought during this rise OR we're in subsequent rises waiting for explosion
-                if event_start.date() <= insider_date.date() <= event_end.date():
-                    # Insider bought DURING this rise - enter immediately
-                    # Use price on or after insider date
-                    buy_dates = df[(df.index >= insider_date) & (df.index <= event_end)]
-                    if buy_dates.empty:
-                        rises_seen_so_far.append(event['pct'])
-                        continue
-                    
-                    buy_date = buy_dates.index[0]
-                    buy_price = buy_dates.iloc[0]['Close']
-                    
-                elif insider_date.date() < event_start.date():
-                    # Insider bought before this rise - enter at start of rise
-                    buy_date = event_start
-                    buy_price = event['start_price']
-                else:
-                    rises_seen_so_far.append(event['pct'])
-                    continue
-                
-                # Exit at end of rise
-                sell_date = event_end
-                sell_price = event['end_price']
-                
-                # Position size
-                c_level_titles = ['CEO', 'CFO', 'COO', 'CTO', 'President', 'Chief', 'Vice Chair']
-                insider_info = f"{purchase['insider']} {purchase['title']}"
-                is_c_level = any(title in insider_info for title in c_level_titles)
-                position_size = 4000 if is_c_level else 2000
-                
-                # Calculate return
-                return_pct = ((sell_price - buy_price) / buy_price) * 100
-                profit_loss = position_size * (return_pct / 100)
-                
-                all_trades.append({
-                    'ticker': ticker,
-                    'insider_date': insider_date.strftime('%Y-%m-%d'),
-                    'insider_value': purchase['value'],
-                    'insider_name': purchase['insider'],
-                    'entry_date': buy_date.strftime('%Y-%m-%d'),
-                    'entry_price': round(buy_price, 2),
-                    'exit_date': sell_date.strftime('%Y-%m-%d'),
-                    'exit_price': round(sell_price, 2),
-                    'days_held': (sell_date - buy_date).days,
-                    'return_pct': round(return_pct, 2),
-                    'position_size': position_size,
-                    'profit_loss': round(profit_loss, 2),
-                    'rise_pct': event['pct'],
-                    'is_explosion': False
-                })
-                
-                # Check if this was an explosion
-                if is_explosion(event['pct'], rises_seen_so_far):
-                    all_trades[-1]['is_explosion'] = True
-                    explosion_found = True
-                
-                rises_seen_so_far.append(event['pct'])
+            all_trades.append({
+                'ticker': ticker,
+                'insider_date': purchase['date'].strftime('%Y-%m-%d'),
+                'insider_value': purchase['value'],
+                'insider_name': purchase['insider'],
+                'entry_date': buy_date.strftime('%Y-%m-%d'),
+                'entry_price': round(buy_price, 2),
+                'exit_date': sell_date.strftime('%Y-%m-%d'),
+                'exit_price': round(sell_price, 2),
+                'days_held': (sell_date - buy_date).days,
+                'return_pct': round(return_pct, 2),
+                'position_size': position_size,
+                'profit_loss': round(profit_loss, 2),
+                'rise_pct': rise_pcts[event_idx],
+                'is_explosion': bool(is_explosion[event_idx])
+            })
         
         if (ticker_idx + 1) % 100 == 0:
             print(f"Processed {ticker_idx + 1}/{len(tickers_with_purchases)} tickers...")
@@ -17,324 +17,608 @@ Rules:
 8. Second dip without new high: SELL (trend reversed)
 """
 
-import json
+import os
+import time
+import argparse
+import logging
+import orjson
 import yfinance as yf
+import numpy as np
 import pandas as pd
+from numba import njit
 from datetime import datetime, timedelta
 from collections import defaultdict
-from multiprocessing import Pool, cpu_count
+from functools import lru_cache
+from multiprocessing import Pool, cpu_count, shared_memory
+from operator import itemgetter
 
-def fetch_ticker_data(ticker):
-    """Fetch historical data for a ticker"""
-    try:
-        stock = yf.Ticker(ticker)
-        history = stock.history(start='2022-03-16', end='2026-02-14')
+# Per-day trade narration (catalysts, dips, recoveries) - very noisy on a full run
+DEBUG = False
+
+logging.basicConfig(format='%(message)s')
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG if DEBUG else logging.WARNING)
+
+# run_position exit codes
+EXIT_NONE = 0
+EXIT_STOP_LOSS = 1
+EXIT_TREND_REVERSAL = 2
+EXIT_REASONS = {EXIT_STOP_LOSS: 'stop_loss', EXIT_TREND_REVERSAL: 'trend_reversal'}
+
+# run_position narration event codes (only recorded when DEBUG logging is on)
+EVENT_CATALYST = 1
+EVENT_NEW_HIGH = 2
+EVENT_CATALYST_EXPIRED = 3
+EVENT_TRACE = 4
+EVENT_SLOPE_TRACE = 5
+EVENT_VIOLENT_DIP = 6
+EVENT_RECOVERY = 7
+EVENT_TREND_REVERSAL = 8
+
+# Downloaded price history, one parquet file per ticker
+PRICE_CACHE_DIR = '/Users/sagiv.oron/Documents/scripts_playground/stocks/output CSVs/price_cache_trend_following'
+PRICE_CACHE_MAX_AGE_HOURS = 24
+
+def fetch_price_data(tickers, start='2022-03-16', end='2026-02-14', batch_size=20):
+    """
+    Download historical data with one yf.download request per batch of tickers.
+    Yahoo accepts up to 20 symbols per request.
+    
+    Returns: dict of ticker -> history DataFrame (tickers without data are skipped)
+    """
+    price_cache = {}
+    
+    for batch_start in range(0, len(tickers), batch_size):
+        batch = tickers[batch_start:batch_start + batch_size]
         
-        if not history.empty:
-            history.index = history.index.tz_localize(None)
-            return (ticker, history)
-    except:
-        pass
-    return (ticker, None)
+        try:
+            data = yf.download(batch, start=start, end=end, group_by='ticker',
+                               threads=True, progress=False, auto_adjust=True)
+        except Exception as e:
+            print(f"   ⚠️  Batch starting at {batch[0]} failed: {e}")
+            continue
+        
+        for ticker in batch:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                history = data[ticker]
+            else:
+                history = data
+            
+            history = history.dropna(how='all')
+            if not history.empty:
+                history.index = history.index.tz_localize(None)
+                price_cache[ticker] = history
+        
+        print(f"   {min(batch_start + batch_size, len(tickers))}/{len(tickers)} tickers downloaded")
+    
+    return price_cache
 
+def price_cache_path(ticker, start, end):
+    """Parquet cache file for one ticker's history over [start, end)"""
+    return os.path.join(PRICE_CACHE_DIR, f'{ticker}_{start}_{end}.parquet')
+
+def load_price_data(tickers, start='2022-03-16', end='2026-02-14', refresh=False):
+    """
+    Load price history from the parquet cache (keyed by ticker, start and end),
+    downloading only tickers that are missing or stale (all of them if refresh).
+    A window that ended in the past never changes, so only files for a window
+    still open are refreshed after PRICE_CACHE_MAX_AGE_HOURS.
+    
+    Returns: dict of ticker -> history DataFrame
+    """
+    os.makedirs(PRICE_CACHE_DIR, exist_ok=True)
+    max_age = PRICE_CACHE_MAX_AGE_HOURS * 3600
+    window_closed = pd.Timestamp(end) <= pd.Timestamp.now().normalize()
+    now = time.time()
+    
+    price_cache = {}
+    to_download = []
+    for ticker in tickers:
+        path = price_cache_path(ticker, start, end)
+        fresh = os.path.exists(path) and (window_closed or now - os.path.getmtime(path) < max_age)
+        if not refresh and fresh:
+            price_cache[ticker] = pd.read_parquet(path)
+        else:
+            to_download.append(ticker)
+    
+    print(f"   📦 {len(price_cache)} tickers from cache, {len(to_download)} to download")
+    
+    downloaded = fetch_price_data(to_download, start=start, end=end)
+    for ticker, history in downloaded.items():
+        history.to_parquet(price_cache_path(ticker, start, end), compression='zstd')
+    price_cache.update(downloaded)
+    
+    return price_cache
+
+# Characters stripped from value strings like '+$8,783,283'
+VALUE_STRIP_TABLE = str.maketrans('', '', '+$,')
+
+@lru_cache(maxsize=100_000)
 def parse_value(value_str):
-    """Parse value string like '+$8,783,283' to float"""
+    """Parse value string like '+$8,783,283' to float (cached - round amounts repeat a lot)"""
     if not value_str:
         return 0
-    cleaned = value_str.replace('+', '').replace('$', '').replace(',', '')
+    cleaned = value_str.translate(VALUE_STRIP_TABLE)
     try:
         return float(cleaned)
     except:
         return 0
 
 def generate_business_days(start_date, end_date):
-    """Generate list of business days between two dates"""
-    start = pd.to_datetime(start_date)
-    end = pd.to_datetime(end_date)
-    business_days = pd.bdate_range(start=start, end=end)
-    return [d.strftime('%Y-%m-%d') for d in business_days]
+    """Generate business days between two dates (DatetimeIndex)"""
+    return pd.bdate_range(start=start_date, end=end_date)
 
-def calculate_velocity(price_history, start_idx, end_idx):
-    """Calculate the velocity (slope) of price movement between two points"""
-    if end_idx <= start_idx or end_idx >= len(price_history):
-        return 0
-    
-    start_date, start_price = price_history[start_idx]
-    end_date, end_price = price_history[end_idx]
+@njit(cache=True)
+def calculate_velocity(close_arr, day_arr, start_idx, end_idx):
+    """
+    Calculate the velocity (slope) of price movement between two rows.
+    day_arr holds calendar days as int64 (e.g. dates.view('i8') for datetime64[D]).
+    """
+    if end_idx <= start_idx or end_idx >= len(close_arr):
+        return 0.0
     
-    days = (end_date - start_date).days
+    days = day_arr[end_idx] - day_arr[start_idx]
     if days == 0:
-        return 0
+        return 0.0
     
-    price_change = end_price - start_price
+    price_change = close_arr[end_idx] - close_arr[start_idx]
     velocity = price_change / days  # dollars per day
     
     return velocity
 
-def detect_trend_reversal(position, current_date, history):
+def share_price_arrays(price_cache, tickers):
     """
-    Detect trend reversal using SLOPE-BASED dip detection.
-    Compare the steepness/angle of dips, not arbitrary percentage thresholds.
+    Pack every ticker's close/high/index into one shared memory block so Pool
+    workers read them in place instead of unpickling a DataFrame per job.
+    The simulation reads float32 prices - plenty for percent moves and half the memory
+    traffic; float64 copies are kept alongside so reported prices match the source data.
+    Block layout: [close f32][high f32][close f64][high f64][index int64], each * rows
     
-    Returns: (should_exit, reason, exit_price)
+    Returns: (shm, total_rows, layout) where layout maps ticker -> (start_row, n_rows)
     """
-    current_date_ts = pd.Timestamp(current_date)
-    
-    if current_date_ts not in history.index:
-        return (False, None, None)
-    
-    close_price = history.loc[current_date_ts, 'Close']
-    high_price = history.loc[current_date_ts, 'High']
-    
-    # Add current price to history
-    position['price_history'].append((current_date_ts, close_price))
+    layout = {}
+    total_rows = 0
+    for ticker in tickers:
+        n_rows = len(price_cache[ticker])
+        layout[ticker] = (total_rows, n_rows)
+        total_rows += n_rows
+    
+    shm = shared_memory.SharedMemory(create=True, size=max(total_rows * 32, 1))
+    close_all, high_all, close64_all, high64_all, index_all = shared_price_views(shm, total_rows)
+    for ticker in tickers:
+        history = price_cache[ticker]
+        start_row, n_rows = layout[ticker]
+        rows = slice(start_row, start_row + n_rows)
+        close64_all[rows] = history['Close'].to_numpy(dtype=np.float64)
+        high64_all[rows] = history['High'].to_numpy(dtype=np.float64)
+        close_all[rows] = close64_all[rows]
+        high_all[rows] = high64_all[rows]
+        index_all[rows] = history.index.values.astype('datetime64[ns]').view('i8')
+    
+    return (shm, total_rows, layout)
+
+def shared_price_views(shm, total_rows):
+    """Zero-copy (close, high, close64, high64, index_i8) arrays over the shared price block"""
+    close_all = np.ndarray((total_rows,), dtype=np.float32, buffer=shm.buf)
+    high_all = np.ndarray((total_rows,), dtype=np.float32, buffer=shm.buf, offset=total_rows * 4)
+    close64_all = np.ndarray((total_rows,), dtype=np.float64, buffer=shm.buf, offset=total_rows * 8)
+    high64_all = np.ndarray((total_rows,), dtype=np.float64, buffer=shm.buf, offset=total_rows * 16)
+    index_all = np.ndarray((total_rows,), dtype=np.int64, buffer=shm.buf, offset=total_rows * 24)
+    return (close_all, high_all, close64_all, high64_all, index_all)
+
+_worker_prices = {}
+
+def attach_shared_prices(shm_name, total_rows):
+    """Pool initializer: map the parent's shared price block into this worker"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_prices['shm'] = shm
+    _worker_prices['views'] = shared_price_views(shm, total_rows)
+
+def ticker_price_arrays(start_row, n_rows):
+    """
+    Slice one ticker out of the shared price block.
     
-    # Calculate current profit from entry
-    current_profit_pct = ((close_price - position['entry_price']) / position['entry_price']) * 100
+    Returns: (close_arr, high_arr, close64, high64, index_i8, dates) where the
+    float32 close/high feed the simulation, close64/high64 are the reporting
+    prices, index_i8 is the sorted history index as int64 nanoseconds (for
+    searchsorted lookups) and dates holds the same index as datetime64[D].
+    """
+    close_all, high_all, close64_all, high64_all, index_all = _worker_prices['views']
+    rows = slice(start_row, start_row + n_rows)
+    index_i8 = index_all[rows]
+    dates = index_i8.view('datetime64[ns]').astype('datetime64[D]')
+    return (close_all[rows], high_all[rows], close64_all[rows], high64_all[rows], index_i8, dates)
+
+@njit(cache=True)
+def history_row(entry_idx, history_idx):
+    """
+    Map a position-relative history index to a row in the ticker's close array.
+    The entry close counts twice (at open and on the entry day's check),
+    so history indexes 0 and 1 both point at the entry row.
+    """
+    return entry_idx + max(history_idx - 1, 0)
+
+@njit(cache=True)
+def slope_pct_per_day(close_arr, start_idx, end_idx, days):
+    """Percentage change per day between two rows of the close array"""
+    start_price = close_arr[start_idx]
+    end_price = close_arr[end_idx]
+    
+    if days > 0 and start_price > 0:
+        price_change_pct = ((end_price - start_price) / start_price) * 100
+        return price_change_pct / days
+    return 0.0
+
+@njit(cache=True)
+def record_event(events, n_events, idx, code, a=0.0, b=0.0, c=0.0, d=0.0, e=0.0):
+    """Append one narration row (idx, code, a, b, c, d, e) if an events buffer was given"""
+    if n_events < events.shape[0]:
+        events[n_events, 0] = idx
+        events[n_events, 1] = code
+        events[n_events, 2] = a
+        events[n_events, 3] = b
+        events[n_events, 4] = c
+        events[n_events, 5] = d
+        events[n_events, 6] = e
+        return n_events + 1
+    return n_events
+
+@njit(cache=True)
+def run_position(close_arr, high_arr, days_held, entry_idx, end_idx, entry_price, events):
+    """
+    Detect trend reversal using SLOPE-BASED dip detection.
+    Compare the steepness/angle of dips, not arbitrary percentage thresholds.
+    Runs one position forward from its entry row up to end_idx (inclusive);
+    days_held[i] is the business-day count on row entry_idx + i.
     
-    # GRACE PERIOD: Don't exit in first 2 business days
-    if position['days_held'] <= 2:
-        return (False, None, None)
+    events is an (N, 7) float buffer for debug-log narration (pass an empty one to skip).
     
-    # Update highest price and track peak
-    if high_price > position['highest_price']:
-        old_peak = position['highest_price']
-        position['highest_price'] = high_price
-        position['peak_date'] = current_date_ts
-        position['peak_idx'] = len(position['price_history']) - 1
+    Returns: (exit_idx, exit_code, highest_price, peak_idx, n_events); exit_idx is -1 if
+    still open, peak_idx is the row that set highest_price (-1 while it is the entry price)
+    """
+    n_events = 0
+    highest_price = entry_price
+    peak_idx = -1
+    catalyst_detected = False  # Wait for explosive spike announcement
+    days_since_peak = 0
+    violent_dip_count = 0
+    in_violent_dip = False
+    failed_recovery = False
+    first_dip_slope = 0.0  # Store slope of first dip for comparison
+    dip_start_idx = 0
+    dip_low = 0.0
+    
+    for idx in range(entry_idx, end_idx + 1):
+        close_price = close_arr[idx]
+        high_price = high_arr[idx]
+        
+        # Position of today's close in this position's price history
+        current_idx = idx - entry_idx + 1
         
-        # Track consecutive up days for sustained uptrend detection
-        if close_price > position.get('last_close', position['entry_price']):
-            position['consecutive_up_days'] = position.get('consecutive_up_days', 0) + 1
+        # Calculate current profit from entry
+        current_profit_pct = ((close_price - entry_price) / entry_price) * 100
+        
+        # GRACE PERIOD: Don't exit in first 2 business days
+        if days_held[idx - entry_idx] <= 2:
+            continue
+        
+        # Update highest price and track peak
+        if high_price > highest_price:
+            old_peak = highest_price
+            highest_price = high_price
+            peak_idx = idx
+            
+            # EXPLOSIVE CATALYST DETECTION: Look for sharp announcement spike
+            # Check if this is an explosive move (not slow grind)
+            if not catalyst_detected:
+                # Look back 3-5 days to detect explosive rise
+                lookback_window = min(5, current_idx + 1)
+                if lookback_window >= 3:
+                    lookback_idx = current_idx + 1 - lookback_window
+                    lookback_price = close_arr[history_row(entry_idx, lookback_idx)]
+                    gain_pct = ((high_price - lookback_price) / lookback_price) * 100
+                    
+                    # Explosive: >20% gain in 3-5 days
+                    if gain_pct > 20.0:
+                        catalyst_detected = True
+                        days_since_peak = 0
+                        n_events = record_event(events, n_events, idx, EVENT_CATALYST, gain_pct, lookback_window)
+            
+            # New high reached - reset dip tracking AND days since peak
+            if high_price > old_peak * 1.02:  # At least 2% higher
+                violent_dip_count = 0
+                in_violent_dip = False
+                failed_recovery = False
+                days_since_peak = 0  # Reset - we're at a new peak!
+                if catalyst_detected:
+                    n_events = record_event(events, n_events, idx, EVENT_NEW_HIGH, high_price)
         else:
-            position['consecutive_up_days'] = 1
+            # Not a new high - increment days since peak
+            days_since_peak += 1
         
-        # Reset decline tracking on new high
-        position['consecutive_decline_days'] = 0
+        # SAFETY STOP LOSS: Active during waiting phase, disabled during trend detection
+        # Calculate drawdown from catalyst peak (if detected)
+        peak = highest_price
+        drawdown_from_peak_pct = ((close_price - peak) / peak) * 100
         
-        # EXPLOSIVE CATALYST DETECTION: Look for sharp announcement spike
-        # Check if this is an explosive move (not slow grind)
-        if not position.get('catalyst_detected', False):
-            # Look back 3-5 days to detect explosive rise
-            lookback_window = min(5, len(position['price_history']))
-            if lookback_window >= 3:
-                lookback_idx = len(position['price_history']) - lookback_window
-                lookback_price = position['price_history'][lookback_idx][1]
-                gain_pct = ((high_price - lookback_price) / lookback_price) * 100
-                
-                # Explosive: >20% gain in 3-5 days
-                if gain_pct > 20.0:
-                    position['catalyst_detected'] = True
-                    position['catalyst_price'] = high_price
-                    position['days_since_peak'] = 0
-                    print(f"      🚀 EXPLOSIVE CATALYST DETECTED for {position['ticker']}: +{gain_pct:.1f}% in {lookback_window} days!")
-                    print(f"         NOW watching for trend reversal (double-dip pattern)")
+        # Expire catalyst tracking if:
+        # 1. No new high in 15+ days (fast movers reverse quickly) OR
+        # 2. Dropped 15%+ from peak (trend clearly over)
+        catalyst_expired = False
+        if catalyst_detected and (days_since_peak >= 15 or drawdown_from_peak_pct <= -15.0):
+            catalyst_expired = True
+            n_events = record_event(events, n_events, idx, EVENT_CATALYST_EXPIRED, days_since_peak, drawdown_from_peak_pct)
         
-        # New high reached - reset dip tracking AND days since peak
-        if high_price > old_peak * 1.02:  # At least 2% higher
-            position['violent_dip_count'] = 0
-            position['in_violent_dip'] = False
-            position['failed_recovery'] = False
-            position['days_since_peak'] = 0  # Reset - we're at a new peak!
-            if position.get('catalyst_detected', False):
-                print(f"      ✅ NEW HIGH for {position['ticker']}: ${high_price:.2f} - trend intact, reset dip counter")
-    else:
-        # Not a new high - increment days since peak
-        position['days_since_peak'] = position.get('days_since_peak', 0) + 1
+        # Apply stop loss if:
+        # 1. No catalyst yet (waiting phase) OR
+        # 2. Catalyst expired (trend over)
+        if (not catalyst_detected or catalyst_expired) and current_profit_pct < -5.0:
+            return (idx, EXIT_STOP_LOSS, highest_price, peak_idx, n_events)
         
-        # Track if we're going up (recovering) or down
-        if close_price < position.get('last_close', position['entry_price']):
-            position['consecutive_up_days'] = 0
-        else:
-            position['consecutive_up_days'] = position.get('consecutive_up_days', 0) + 1
-    
-    position['last_close'] = close_price
-    
-    # SAFETY STOP LOSS: Active during waiting phase, disabled during trend detection
-    catalyst_detected = position.get('catalyst_detected', False)
-    days_since_peak = position.get('days_since_peak', 0)
-    
-    # Calculate drawdown from catalyst peak (if detected)
-    peak = position['highest_price']
-    drawdown_from_peak_pct = ((close_price - peak) / peak) * 100
-    
-    # Expire catalyst tracking if:
-    # 1. No new high in 15+ days (fast movers reverse quickly) OR
-    # 2. Dropped 15%+ from peak (trend clearly over)
-    catalyst_expired = False
-    if catalyst_detected and (days_since_peak >= 15 or drawdown_from_peak_pct <= -15.0):
-        catalyst_expired = True
-        reason = f"{days_since_peak} days since peak" if days_since_peak >= 15 else f"{drawdown_from_peak_pct:.1f}% below peak"
-        print(f"      ⏰ CATALYST EXPIRED for {position['ticker']}: {reason} - re-enabling stop loss")
-    
-    # Trend detection mode: Catalyst detected AND currently watching for dips AND not expired
-    in_trend_detection_mode = catalyst_detected and not catalyst_expired and (position['violent_dip_count'] > 0 or position['in_violent_dip'])
-    
-    # Apply stop loss if:
-    # 1. No catalyst yet (waiting phase) OR
-    # 2. Catalyst expired (trend over)
-    if (not catalyst_detected or catalyst_expired) and current_profit_pct < -5.0:
-        return (True, 'stop_loss', close_price)
-    
-    # SLOPE-BASED DIP DETECTION: Only after catalyst detected
-    # We care about trajectory (degrees/slope)
-    if not catalyst_detected:
-        return (False, None, None)  # Still waiting for explosive spike
-    
-    # Calculate drawdown from peak
-    drawdown_pct = ((close_price - peak) / peak) * 100
-    
-    # DEBUG for specific tickers
-    if position['ticker'] in ['GME', 'THM']:
-        print(f"      DEBUG {position['ticker']} {current_date_ts.date()}: close=${close_price:.2f}, peak=${peak:.2f}, drawdown={drawdown_pct:.1f}%, in_dip={position['in_violent_dip']}, dip_count={position.get('violent_dip_count', 0)}")
-    
-    # Detect violent dips (last 1-2 days for responsiveness)
-    if drawdown_pct < -3.0 and not position['in_violent_dip']:
-        is_violent = False
-        reason = ""
+        # SLOPE-BASED DIP DETECTION: Only after catalyst detected
+        # We care about trajectory (degrees/slope)
+        if not catalyst_detected:
+            continue  # Still waiting for explosive spike
         
-        current_idx = len(position['price_history']) - 1
-        lookback = min(2, current_idx)
-        if lookback > 0:
-            lookback_idx = current_idx - lookback
-            recent_prices = position['price_history'][lookback_idx:current_idx + 1]
-            
-            # Calculate slope: PERCENTAGE per day (universal across all stock prices)
-            start_price = recent_prices[0][1]
-            end_price = recent_prices[-1][1]
-            days = len(recent_prices) - 1
-            
-            if days > 0 and start_price > 0:
-                # Percentage change per day
-                price_change_pct = ((end_price - start_price) / start_price) * 100
-                slope_pct_per_day = price_change_pct / days
-                slope_pct_abs = abs(slope_pct_per_day)
-            else:
-                slope_pct_per_day = 0
-                slope_pct_abs = 0
-            
-            # DEBUG for specific tickers
-            if position['ticker'] in ['GME', 'THM']:
-                print(f"      DEBUG {position['ticker']} {current_date_ts.date()}: drawdown={drawdown_pct:.1f}%, recent_slope={slope_pct_abs:.1f}%/day, dip_count={position.get('violent_dip_count', 0)}, first_dip_slope={position.get('first_dip_slope', 0):.1f}%/day, in_dip={position['in_violent_dip']}")
-            
-            if position.get('violent_dip_count', 0) == 0:
-                # First dip: needs to be steep enough (at least 5% per day drop)
-                if slope_pct_abs > 5.0:
-                    is_violent = True
-                    position['first_dip_slope'] = slope_pct_abs  # Store for comparison!
-                    reason = f"slope {slope_pct_abs:.1f}%/day (first dip)"
+        # Calculate drawdown from peak
+        drawdown_pct = ((close_price - peak) / peak) * 100
+        n_events = record_event(events, n_events, idx, EVENT_TRACE, close_price, peak, drawdown_pct, in_violent_dip, violent_dip_count)
+        
+        # Detect violent dips (last 1-2 days for responsiveness)
+        if drawdown_pct < -3.0 and not in_violent_dip:
+            is_violent = False
             
-            # Second dip: Compare slope to first dip's slope
-            else:
-                first_dip_slope = position.get('first_dip_slope', 0)
-                if first_dip_slope > 0:
+            lookback = min(2, current_idx)
+            if lookback > 0:
+                lookback_idx = current_idx - lookback
+                
+                # Calculate slope: PERCENTAGE per day (universal across all stock prices)
+                slope_pct_abs = abs(slope_pct_per_day(
+                    close_arr,
+                    history_row(entry_idx, lookback_idx),
+                    history_row(entry_idx, current_idx),
+                    lookback
+                ))
+                n_events = record_event(events, n_events, idx, EVENT_SLOPE_TRACE, drawdown_pct, slope_pct_abs, violent_dip_count, first_dip_slope, in_violent_dip)
+                
+                if violent_dip_count == 0:
+                    # First dip: needs to be steep enough (at least 5% per day drop)
+                    if slope_pct_abs > 5.0:
+                        is_violent = True
+                        first_dip_slope = slope_pct_abs  # Store for comparison!
+                
+                # Second dip: Compare slope to first dip's slope
+                elif first_dip_slope > 0:
                     slope_ratio = slope_pct_abs / first_dip_slope
                     
                     # If current drop is at least 50% as steep as first dip → it's violent!
                     # Also require minimum 3%/day to avoid tiny jiggles
                     if slope_ratio >= 0.5 and slope_pct_abs > 3.0:
                         is_violent = True
-                        reason = f"slope {slope_pct_abs:.1f}%/day vs {first_dip_slope:.1f}%/day (ratio: {slope_ratio:.0%})"
-            
-            if is_violent:
-                position['in_violent_dip'] = True
-                position['violent_dip_count'] += 1
-                position['dip_start_date'] = current_date_ts
-                position['dip_start_idx'] = current_idx
-                print(f"      🔻 VIOLENT DIP #{position['violent_dip_count']} for {position['ticker']}")
-                print(f"         Drawdown: {drawdown_pct:.1f}% | {reason}")
-    
-    # Check if we're recovering from a violent dip
-    if position['in_violent_dip']:
-        dip_start_idx = position['dip_start_idx']
-        current_idx = len(position['price_history']) - 1
+                
+                if is_violent:
+                    in_violent_dip = True
+                    violent_dip_count += 1
+                    dip_start_idx = current_idx
+                    dip_low = close_price
+                    n_events = record_event(events, n_events, idx, EVENT_VIOLENT_DIP, violent_dip_count, drawdown_pct, slope_pct_abs, first_dip_slope)
         
-        if current_idx > dip_start_idx:
-            # Find the low point since dip started
-            dip_low = min([p for _, p in position['price_history'][dip_start_idx:current_idx + 1]])
-            recovery_pct = ((close_price - dip_low) / dip_low) * 100
+        # Check if we're recovering from a violent dip
+        if in_violent_dip:
+            # Running low point since dip started
+            dip_low = min(dip_low, close_price)
             
-            # Recovery detected: at least 3% up from the low
-            if recovery_pct > 3.0:
-                print(f"      ↗️  Recovery from violent dip for {position['ticker']}: +{recovery_pct:.1f}% from low")
-                
-                # Check if we made a NEW HIGH before marking dip as over
-                peak = position['highest_price']
-                if close_price > peak * 0.98:  # Within 2% of old peak
-                    print(f"      ✅ Recovery reached near peak - trend continues!")
-                    position['failed_recovery'] = False
-                else:
-                    # Failed to make new high - mark this BEFORE clearing in_violent_dip
-                    print(f"      ⚠️  Failed recovery - didn't reach new high (peak: ${peak:.2f}, now: ${close_price:.2f})")
-                    position['failed_recovery'] = True
+            if current_idx > dip_start_idx:
+                recovery_pct = ((close_price - dip_low) / dip_low) * 100
                 
-                # Now mark dip as over
-                position['in_violent_dip'] = False
+                # Recovery detected: at least 3% up from the low
+                if recovery_pct > 3.0:
+                    # Check if we made a NEW HIGH before marking dip as over
+                    peak = highest_price
+                    # Within 2% of old peak - trend continues; otherwise a failed
+                    # recovery, marked BEFORE clearing in_violent_dip
+                    failed_recovery = not (close_price > peak * 0.98)
+                    n_events = record_event(events, n_events, idx, EVENT_RECOVERY, recovery_pct, peak, close_price, failed_recovery)
+                    
+                    # Now mark dip as over
+                    in_violent_dip = False
+        
+        # DECISION: Sell on second violent dip after failed recovery
+        if violent_dip_count >= 2 and in_violent_dip and failed_recovery:
+            n_events = record_event(events, n_events, idx, EVENT_TREND_REVERSAL)
+            return (idx, EXIT_TREND_REVERSAL, highest_price, peak_idx, n_events)
     
-    # DECISION: Sell on second violent dip after failed recovery
-    if position['violent_dip_count'] >= 2 and position['in_violent_dip'] and position['failed_recovery']:
-        print(f"      🚨 SECOND VIOLENT DIP after failed recovery - TREND REVERSED - EXITING {position['ticker']}")
-        return (True, 'trend_reversal', close_price)
+    return (-1, EXIT_NONE, highest_price, peak_idx, n_events)
+
+def narrate_events(ticker, events, dates):
+    """Log the DEBUG narration recorded by run_position"""
+    for row in events:
+        idx, code = int(row[0]), int(row[1])
+        a, b, c, d, e = row[2], row[3], row[4], row[5], row[6]
+        if code == EVENT_CATALYST:
+            log.debug(f"      🚀 EXPLOSIVE CATALYST DETECTED for {ticker}: +{a:.1f}% in {int(b)} days!")
+            log.debug(f"         NOW watching for trend reversal (double-dip pattern)")
+        elif code == EVENT_NEW_HIGH:
+            log.debug(f"      ✅ NEW HIGH for {ticker}: ${a:.2f} - trend intact, reset dip counter")
+        elif code == EVENT_CATALYST_EXPIRED:
+            reason = f"{int(a)} days since peak" if a >= 15 else f"{b:.1f}% below peak"
+            log.debug(f"      ⏰ CATALYST EXPIRED for {ticker}: {reason} - re-enabling stop loss")
+        elif code == EVENT_TRACE and ticker in ['GME', 'THM']:
+            log.debug(f"      DEBUG {ticker} {dates[idx]}: close=${a:.2f}, peak=${b:.2f}, drawdown={c:.1f}%, in_dip={bool(d)}, dip_count={int(e)}")
+        elif code == EVENT_SLOPE_TRACE and ticker in ['GME', 'THM']:
+            log.debug(f"      DEBUG {ticker} {dates[idx]}: drawdown={a:.1f}%, recent_slope={b:.1f}%/day, dip_count={int(c)}, first_dip_slope={d:.1f}%/day, in_dip={bool(e)}")
+        elif code == EVENT_VIOLENT_DIP:
+            if int(a) == 1:
+                reason = f"slope {c:.1f}%/day (first dip)"
+            else:
+                reason = f"slope {c:.1f}%/day vs {d:.1f}%/day (ratio: {c / d:.0%})"
+            log.debug(f"      🔻 VIOLENT DIP #{int(a)} for {ticker}")
+            log.debug(f"         Drawdown: {b:.1f}% | {reason}")
+        elif code == EVENT_RECOVERY:
+            log.debug(f"      ↗️  Recovery from violent dip for {ticker}: +{a:.1f}% from low")
+            if d:
+                log.debug(f"      ⚠️  Failed recovery - didn't reach new high (peak: ${b:.2f}, now: ${c:.2f})")
+            else:
+                log.debug(f"      ✅ Recovery reached near peak - trend continues!")
+        elif code == EVENT_TREND_REVERSAL:
+            log.debug(f"      🚨 SECOND VIOLENT DIP after failed recovery - TREND REVERSED - EXITING {ticker}")
+
+def simulate_ticker(job):
+    """
+    Open and run every position for one ticker (Pool worker).
+    job is (ticker, trades, (start_row, n_rows), end_date, initial_position_size);
+    each trade carries 'seq', its position in the date-sorted list of all trades.
+    
+    Returns: list of (order_key, closed trade row). Sorting on order_key gives the
+    row order of the old day-by-day loop: dated exits by exit day, then positions
+    still open at end_date. Within a day that loop walked its open-positions dict -
+    tickers in the order their current run of open positions began (an emptied
+    ticker re-enters at the end), each ticker's positions in the order they opened.
+    """
+    ticker, trades, rows, end_date, initial_position_size = job
+    close_arr, high_arr, close64, high64, index_i8, dates = ticker_price_arrays(*rows)
+    narrate = log.isEnabledFor(logging.DEBUG)
+    end_day = np.datetime64(end_date)
+    closed_trades = []
+    run_start_seq = -1  # seq of the trade that opened this ticker's current run of open positions
+    run_last_exit = ''  # Latest exit date in that run; '~' sorts after any date (still open at the end)
+    
+    # Last trading day on or before the end of the backtest
+    end_day_ns = end_day.astype('datetime64[ns]').astype('i8')
+    end_idx = np.searchsorted(index_i8, end_day_ns, side='right') - 1
+    if end_idx < 0:
+        return closed_trades
+    
+    for trade in trades:
+        current_date = trade['entry_date']
+        open_day = np.datetime64(current_date)
+        open_day_ns = open_day.astype('datetime64[ns]').astype('i8')
+        # First trading day on or after the signal date
+        entry_idx = np.searchsorted(index_i8, open_day_ns)
+        if entry_idx >= len(index_i8):
+            continue
+        if index_i8[entry_idx] == open_day_ns:
+            actual_entry_date = current_date
+        else:
+            actual_entry_date = str(dates[entry_idx])
+        
+        # Simulate on the float32 close; report the float64 one from the source data
+        entry_price = float(close64[entry_idx])
+        
+        position_size = initial_position_size
+        shares = position_size / entry_price
+        
+        # days_held counts business days from the signal day, holidays included
+        days_held = np.busday_count(open_day, dates[entry_idx:end_idx + 1] + 1)
+        events = np.empty((8 * len(days_held) if narrate else 0, 7))
+        exit_idx, exit_code, _, peak_idx, n_events = run_position(
+            close_arr, high_arr, days_held, entry_idx, end_idx, float(close_arr[entry_idx]), events
+        )
+        if narrate:
+            narrate_events(ticker, events[:n_events], dates)
+        
+        position = {
+            'ticker': ticker,
+            'company': trade['company'],
+            'trade_date': trade['trade_date'],
+            'entry_date': actual_entry_date,
+            'entry_price': entry_price,
+            'amount_invested': position_size,
+            'shares': shares,
+            'insider': trade['insider'],
+            'role': trade['role'],
+            'highest_price': float(high64[peak_idx]) if peak_idx >= 0 else entry_price
+        }
+        
+        if exit_idx >= 0:
+            position['days_held'] = int(days_held[exit_idx - entry_idx])
+            exit_date = str(dates[exit_idx])
+            exit_price = close64[exit_idx]
+            reason = EXIT_REASONS[exit_code]
+        else:
+            # Still open at the end of the backtest - close at the last price
+            position['days_held'] = int(np.busday_count(open_day, end_day + 1))
+            exit_date = str(dates[end_idx])
+            exit_price = close64[end_idx]
+            reason = 'end_of_period'
+        
+        # Opens come before the exit checks, so a position exiting on this signal day still counts
+        if run_last_exit < current_date:
+            run_start_seq = trade['seq']
+        run_last_exit = max(run_last_exit, '~' if exit_idx < 0 else exit_date)
+        order_key = (exit_idx < 0, exit_date if exit_idx >= 0 else '', run_start_seq, trade['seq'])
+        closed_trades.append((order_key, build_closed_trade(position, exit_date, float(exit_price), reason)))
     
-    return (False, None, None)
+    return closed_trades
 
-def backtest_trend_following():
-    """Backtest the trend following strategy"""
+def build_closed_trade(position, exit_date, exit_price, exit_reason):
+    """Build the result row for a closed position"""
+    return_pct = ((exit_price - position['entry_price']) / position['entry_price']) * 100
+    profit_loss = position['amount_invested'] * (return_pct / 100)
+    returned_amount = position['amount_invested'] + profit_loss
+    
+    return {
+        'ticker': position['ticker'],
+        'company': position['company'],
+        'trade_date': position['trade_date'],
+        'entry_date': position['entry_date'],
+        'entry_price': position['entry_price'],
+        'exit_date': exit_date,
+        'exit_price': exit_price,
+        'exit_reason': exit_reason,
+        'amount_invested': position['amount_invested'],
+        'returned_amount': returned_amount,
+        'profit_loss': profit_loss,
+        'return_pct': return_pct,
+        'shares': position['shares'],
+        'days_held': position['days_held'],
+        'highest_price': position['highest_price'],
+        'peak_gain': ((position['highest_price'] - position['entry_price']) / position['entry_price']) * 100
+    }
+
+def backtest_trend_following(refresh=False):
+    """Backtest the trend following strategy (refresh=True re-downloads all prices)"""
     
     print(f"\n{'='*100}")
     print("TREND FOLLOWING STRATEGY - 'RIDE THE WAVE, EXIT ON DOUBLE DIP'")
     print(f"{'='*100}\n")
     
     # Load insider trades data
-    with open('/Users/sagiv.oron/Documents/scripts_playground/stocks/output CSVs/merged_insider_trades.json', 'r') as f:
-        data = json.load(f)
+    with open('/Users/sagiv.oron/Documents/scripts_playground/stocks/output CSVs/merged_insider_trades.json', 'rb') as f:
+        data = orjson.loads(f.read())
     
-    tickers = [stock['ticker'] for stock in data['data']]
+    tickers = list(dict.fromkeys(stock['ticker'] for stock in data['data']))
     
     print(f"🔄 Loading stock data for {len(tickers)} tickers...")
-    with Pool(cpu_count()) as pool:
-        results = pool.map(fetch_ticker_data, tickers)
-    
-    price_cache = {}
-    for ticker, history in results:
-        if history is not None:
-            price_cache[ticker] = history
+    price_cache = load_price_data(tickers, refresh=refresh)
     
     print(f"   ✅ Loaded {len(price_cache)} stocks with price data\n")
     
-    # Build trading signals
-    all_trades = []
-    for stock_data in data['data']:
-        ticker = stock_data['ticker']
-        
-        if ticker not in price_cache:
-            continue
-        
-        company = stock_data['company_name']
-        
-        for trade in stock_data['trades']:
-            if trade.get('value', '').startswith('+'):
-                trade_date = trade['trade_date']
-                
-                if 'filing_date' in trade and trade['filing_date']:
-                    filing_date = trade['filing_date'].split()[0]
-                else:
-                    filing_date = trade_date
-                
-                entry_date = filing_date
-                trade_value = parse_value(trade['value'])
-                
-                all_trades.append({
-                    'ticker': ticker,
-                    'company': company,
-                    'trade_date': trade_date,
-                    'entry_date': entry_date,
-                    'insider': trade['insider_name'],
-                    'role': trade.get('role', ''),
-                    'value': trade_value
-                })
-    
-    all_trades.sort(key=lambda x: x['entry_date'])
+    # Build trading signals: one flat frame of every trade, filtered to purchases
+    trades_df = pd.json_normalize(data['data'], 'trades', ['ticker', 'company_name'], meta_prefix='stock_')
+    trades_df = trades_df.reindex(columns=['stock_ticker', 'stock_company_name', 'trade_date', 'filing_date',
+                                           'insider_name', 'role', 'value'])
+    # A field no trade carries comes back from reindex as all-NaN float64; .str needs strings
+    trades_df = trades_df.astype({'filing_date': 'string', 'value': 'string'})
+    trades_df = trades_df[
+        trades_df['stock_ticker'].isin(price_cache.keys()) & trades_df['value'].str.startswith('+', na=False)
+    ]
+    
+    # Enter on the filing date (time stripped) when there is one, else the trade date
+    has_filing = trades_df['filing_date'].notna() & (trades_df['filing_date'] != '')
+    entry_dates = trades_df['filing_date'].str.split().str[0].where(has_filing, trades_df['trade_date'])
+    
+    all_trades = pd.DataFrame({
+        'ticker': trades_df['stock_ticker'],
+        'company': trades_df['stock_company_name'],
+        'trade_date': trades_df['trade_date'],
+        'entry_date': entry_dates,
+        'insider': trades_df['insider_name'],
+        'role': trades_df['role'].fillna(''),
+        'value': trades_df['value'].map(parse_value)
+    }).sort_values('entry_date', kind='stable').to_dict('records')
     
     if not all_trades:
         print("No trades found!")
@@ -347,167 +631,42 @@ def backtest_trend_following():
     all_business_days = generate_business_days(start_date, end_date)
     print(f"   {len(all_business_days)} business days\n")
     
-    open_positions = defaultdict(list)
+    # Positions only open on a business day inside the backtest window
+    entry_dates = pd.to_datetime([t['entry_date'] for t in all_trades], format='%Y-%m-%d', errors='coerce')
+    in_window = entry_dates.isin(all_business_days)
+    
+    trades_by_ticker = defaultdict(list)
+    for seq, (trade, opens) in enumerate(zip(all_trades, in_window)):
+        if opens:
+            trade['seq'] = seq
+            trades_by_ticker[trade['ticker']].append(trade)
+    
     closed_trades = []
-    pending_trades = list(all_trades)
     
     initial_position_size = 1000
+    shm, total_rows, layout = share_price_arrays(price_cache, list(trades_by_ticker))
+    jobs = [
+        (ticker, trades, layout[ticker], end_date, initial_position_size)
+        for ticker, trades in trades_by_ticker.items()
+    ]
     
     print(f"{'='*100}")
     print("RUNNING TREND FOLLOWING BACKTEST")
     print(f"{'='*100}\n")
     
-    for day_idx, current_date in enumerate(all_business_days):
-        if day_idx % 50 == 0:
-            print(f"📆 {current_date} (Day {day_idx+1}/{len(all_business_days)}) | Open: {sum(len(v) for v in open_positions.values())} | Closed: {len(closed_trades)}")
-        
-        # Open new positions
-        trades_to_open = [t for t in pending_trades if t['entry_date'] == current_date]
-        
-        for trade in trades_to_open:
-            ticker = trade['ticker']
-            
-            if ticker not in price_cache:
-                pending_trades.remove(trade)
-                continue
-            
-            history = price_cache[ticker]
-            
-            current_date_ts = pd.Timestamp(current_date)
-            if current_date_ts not in history.index:
-                available_dates = sorted([d for d in history.index if d >= current_date_ts])
-                if not available_dates:
-                    pending_trades.remove(trade)
-                    continue
-                actual_entry_date = available_dates[0].strftime('%Y-%m-%d')
-            else:
-                actual_entry_date = current_date
-            
-            actual_entry_ts = pd.Timestamp(actual_entry_date)
-            entry_price = history.loc[actual_entry_ts, 'Close']
-            
-            position_size = initial_position_size
-            shares = position_size / entry_price
-            
-            position = {
-                'ticker': ticker,
-                'company': trade['company'],
-                'trade_date': trade['trade_date'],
-                'entry_date': actual_entry_date,
-                'entry_price': entry_price,
-                'amount_invested': position_size,
-                'shares': shares,
-                'insider': trade['insider'],
-                'role': trade['role'],
-                'highest_price': entry_price,
-                'days_held': 0,
-                'violent_dip_count': 0,
-                'in_violent_dip': False,
-                'failed_recovery': False,
-                'catalyst_detected': False,  # Wait for explosive spike announcement
-                'consecutive_up_days': 0,
-                'days_since_peak': 0,
-                'first_dip_slope': 0,  # Store slope of first dip for comparison
-                'last_close': entry_price,
-                'peak_date': actual_entry_ts,
-                'peak_idx': 0,
-                'catalyst_price': 0,  # Price when catalyst detected
-                'dip_start_date': None,
-                'dip_start_idx': 0,
-                'price_history': [(actual_entry_ts, entry_price)]
-            }
-            
-            open_positions[ticker].append(position)
-            pending_trades.remove(trade)
-        
-        # Check all open positions for exit signals
-        for ticker in list(open_positions.keys()):
-            if ticker not in price_cache:
-                continue
-            
-            history = price_cache[ticker]
-            
-            positions_to_close = []
-            
-            for pos in open_positions[ticker]:
-                pos['days_held'] += 1
-                
-                should_exit, reason, exit_price = detect_trend_reversal(pos, current_date, history)
-                
-                if should_exit:
-                    return_pct = ((exit_price - pos['entry_price']) / pos['entry_price']) * 100
-                    profit_loss = pos['amount_invested'] * (return_pct / 100)
-                    returned_amount = pos['amount_invested'] + profit_loss
-                    
-                    closed_trades.append({
-                        'ticker': ticker,
-                        'company': pos['company'],
-                        'trade_date': pos['trade_date'],
-                        'entry_date': pos['entry_date'],
-                        'entry_price': pos['entry_price'],
-                        'exit_date': current_date,
-                        'exit_price': exit_price,
-                        'exit_reason': reason,
-                        'amount_invested': pos['amount_invested'],
-                        'returned_amount': returned_amount,
-                        'profit_loss': profit_loss,
-                        'return_pct': return_pct,
-                        'shares': pos['shares'],
-                        'days_held': pos['days_held'],
-                        'highest_price': pos['highest_price'],
-                        'peak_gain': ((pos['highest_price'] - pos['entry_price']) / pos['entry_price']) * 100
-                    })
-                    
-                    positions_to_close.append(pos)
-            
-            for pos in positions_to_close:
-                open_positions[ticker].remove(pos)
-            
-            if not open_positions[ticker]:
-                del open_positions[ticker]
-    
-    # Close remaining positions
-    print(f"\n{'='*100}")
-    print("CLOSING REMAINING OPEN POSITIONS")
-    print(f"{'='*100}\n")
-    
-    for ticker, positions in open_positions.items():
-        if ticker not in price_cache:
-            continue
-        
-        history = price_cache[ticker]
-        end_date_ts = pd.Timestamp(end_date)
-        available_dates = sorted([d for d in history.index if d <= end_date_ts])
-        
-        if not available_dates:
-            continue
-        
-        final_date = available_dates[-1]
-        final_price = history.loc[final_date, 'Close']
-        
-        for pos in positions:
-            return_pct = ((final_price - pos['entry_price']) / pos['entry_price']) * 100
-            profit_loss = pos['amount_invested'] * (return_pct / 100)
-            returned_amount = pos['amount_invested'] + profit_loss
-            
-            closed_trades.append({
-                'ticker': ticker,
-                'company': pos['company'],
-                'trade_date': pos['trade_date'],
-                'entry_date': pos['entry_date'],
-                'entry_price': pos['entry_price'],
-                'exit_date': final_date.strftime('%Y-%m-%d'),
-                'exit_price': final_price,
-                'exit_reason': 'end_of_period',
-                'amount_invested': pos['amount_invested'],
-                'returned_amount': returned_amount,
-                'profit_loss': profit_loss,
-                'return_pct': return_pct,
-                'shares': pos['shares'],
-                'days_held': pos['days_held'],
-                'highest_price': pos['highest_price'],
-                'peak_gain': ((pos['highest_price'] - pos['entry_price']) / pos['entry_price']) * 100
-            })
+    try:
+        with Pool(cpu_count(), initializer=attach_shared_prices, initargs=(shm.name, total_rows)) as pool:
+            for job_idx, ticker_trades in enumerate(pool.imap(simulate_ticker, jobs)):
+                closed_trades.extend(ticker_trades)
+                if job_idx % 50 == 0:
+                    print(f"📈 {job_idx + 1}/{len(jobs)} tickers | Closed: {len(closed_trades)}")
+    finally:
+        shm.close()
+        shm.unlink()
+
+    # Back into the day-by-day loop's row order (see simulate_ticker)
+    closed_trades.sort(key=itemgetter(0))
+    closed_trades = [trade for _, trade in closed_trades]
     
     # Calculate results
     if not closed_trades:
@@ -515,18 +674,22 @@ def backtest_trend_following():
         return []
     
     df = pd.DataFrame(closed_trades)
+    # Low-cardinality string columns - categories keep one copy per distinct value
+    df = df.astype({'exit_reason': 'category', 'ticker': 'category', 'company': 'category'})
     
     total_invested = df['amount_invested'].sum()
     total_returned = df['returned_amount'].sum()
     total_profit = df['profit_loss'].sum()
     roi = (total_profit / total_invested) * 100
     
-    winning_trades = df[df['return_pct'] > 0]
-    losing_trades = df[df['return_pct'] <= 0]
+    returns = df['return_pct'].to_numpy()
+    win_mask = returns > 0
+    n_winning = int(win_mask.sum())
+    n_losing = len(returns) - n_winning
     
-    win_rate = len(winning_trades) / len(df) * 100
-    avg_return = df['return_pct'].mean()
-    median_return = df['return_pct'].median()
+    win_rate = n_winning / len(returns) * 100
+    avg_return = returns.mean()
+    median_return = np.median(returns)
     avg_days_held = df['days_held'].mean()
     avg_peak_gain = df['peak_gain'].mean()
     
@@ -534,8 +697,8 @@ def backtest_trend_following():
     print("FINAL RESULTS - TREND FOLLOWING STRATEGY")
     print(f"{'='*100}")
     print(f"Total Trades: {len(df)}")
-    print(f"  Winning: {len(winning_trades)} ({win_rate:.1f}%)")
-    print(f"  Losing: {len(losing_trades)} ({100-win_rate:.1f}%)")
+    print(f"  Winning: {n_winning} ({win_rate:.1f}%)")
+    print(f"  Losing: {n_losing} ({100-win_rate:.1f}%)")
     print(f"\nAverage Return per Trade: {avg_return:+.2f}%")
     print(f"Median Return per Trade: {median_return:+.2f}%")
     print(f"Average Peak Gain: {avg_peak_gain:+.2f}% (how high it went)")
@@ -548,17 +711,16 @@ def backtest_trend_following():
     
     # Exit reason breakdown
     print(f"\n📊 EXIT REASONS:")
-    for reason in df['exit_reason'].unique():
-        count = len(df[df['exit_reason'] == reason])
-        avg_return = df[df['exit_reason'] == reason]['return_pct'].mean()
-        print(f"   {reason}: {count} trades (avg return: {avg_return:+.2f}%)")
+    reason_stats = df.groupby('exit_reason', observed=True, sort=False)['return_pct'].agg(['count', 'mean'])
+    for reason, row in reason_stats.iterrows():
+        print(f"   {reason}: {int(row['count'])} trades (avg return: {row['mean']:+.2f}%)")
     
-    best_trade = df.loc[df['return_pct'].idxmax()]
+    best_trade = df.iloc[returns.argmax()]
     print(f"\n🏆 Best Trade: {best_trade['ticker']} - {best_trade['return_pct']:+.1f}%")
     print(f"   ${best_trade['entry_price']:.2f} → ${best_trade['exit_price']:.2f} ({int(best_trade['days_held'])} days)")
     print(f"   Peak: ${best_trade['highest_price']:.2f} ({best_trade['peak_gain']:+.1f}%)")
     
-    worst_trade = df.loc[df['return_pct'].idxmin()]
+    worst_trade = df.iloc[returns.argmin()]
     print(f"\n💀 Worst Trade: {worst_trade['ticker']} - {worst_trade['return_pct']:+.1f}%")
     print(f"   ${worst_trade['entry_price']:.2f} → ${worst_trade['exit_price']:.2f} ({int(worst_trade['days_held'])} days)")
     
@@ -571,4 +733,8 @@ def backtest_trend_following():
     return closed_trades
 
 if __name__ == '__main__':
-    backtest_trend_following()
+    parser = argparse.ArgumentParser(description='Backtest the trend following strategy')
+    parser.add_argument('--refresh', action='store_true', help='Ignore the price cache and re-download everything')
+    args = parser.parse_args()
+    
+    backtest_trend_following(refresh=args.refresh)
@@ -7,12 +7,20 @@ It returns purchases (P) and sales (S) with dates and amounts to overlay on stoc
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import sys
 import json
 from datetime import datetime, timedelta
 import time
 
+# Shared keep-alive session so callers fetching many tickers (possibly from threads)
+# reuse pooled connections to openinsider instead of reconnecting per request
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                                     max_retries=Retry(total=3, backoff_factor=0.3)))
+
 
 def fetch_insider_trades(ticker_symbol, days_back=1461):
     """
@@ -45,7 +53,7 @@ def fetch_insider_trades(ticker_symbol, days_back=1461):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = session.get(url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -5,11 +5,16 @@ This eliminates rate limit issues during backtesting
 """
 
 import json
+import sys
 import yfinance as yf
 import time
 from datetime import datetime
 from multiprocessing import Pool, cpu_count
 import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'utils'))
+from paths import write_gz_copy
 
 # Global progress counter with lock
 progress_counter = 0
@@ -124,6 +129,8 @@ def main():
     with open(output_file, 'w') as f:
         json.dump(cache_data, f)
     
+    write_gz_copy(output_file)
+    
     print(f"\n💾 Saved to: {output_file}")
     print(f"📦 File contains {len(successful_results)} stocks")
     
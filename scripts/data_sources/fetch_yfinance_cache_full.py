@@ -4,11 +4,16 @@ Fetch and cache yfinance data for ALL remaining tickers (batches 2-5)
 """
 
 import json
+import sys
 import yfinance as yf
 import time
 from datetime import datetime
 from multiprocessing import Pool
 import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'utils'))
+from paths import write_gz_copy
 
 # Global progress counter with lock
 progress_counter = 0
@@ -136,6 +141,8 @@ def main():
     with open(output_file, 'w') as f:
         json.dump(cache_data, f)
     
+    write_gz_copy(output_file)
+    
     print(f"\n💾 Saved full cache to: {output_file}")
     print(f"📦 Total stocks in cache: {len(merged_data)}")
     
@@ -20,7 +20,7 @@ df = pd.DataFrame({
     'Low': ticker_data['low'],
     'Close': ticker_data['close'],
     'Volume': ticker_data['volume']
-}, index=pd.to_datetime(ticker_data['dates']))
+}, index=pd.to_datetime(ticker_data['dates'], format='%Y-%m-%d'))
 
 print(f"FTAI data: {len(df)} days from {df.index[0].date()} to {df.index[-1].date()}")
 print()
@@ -23,11 +23,12 @@ def load_grov_data():
     
     # Build DataFrame from the new structure
     # ticker_data has keys: 'ticker', 'dates', 'open', 'high', 'low', 'close', 'volume'
-    dates = [pd.to_datetime(d) for d in ticker_data['dates']]
+    dates = pd.to_datetime(ticker_data['dates'], format='%Y-%m-%d')  # One vectorised parse, not one per date
     closes = ticker_data['close']
     
     df = pd.DataFrame({'Close': closes}, index=dates)
-    df = df.sort_index()
+    if not df.index.is_monotonic_increasing:  # Cached in date order already - only sort if that ever changes
+        df = df.sort_index()
     
     return df
 
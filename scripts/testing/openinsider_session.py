@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for the OpenInsider test scripts in scripts/testing.
+
+Responses are cached on disk for an hour, so re-running a test while working on
+it doesn't hit openinsider again or count toward its rate limit. Check
+response.from_cache to skip the politeness sleep for cached pages.
+
+Scripts here are run directly, so import it as a sibling: `from openinsider_session import session`.
+"""
+
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+CACHE_PATH = '/tmp/openinsider_cache.sqlite'
+CACHE_EXPIRE_SECONDS = 3600
+
+# Keep-alive pooled connections; retries back off on rate limiting / server errors.
+# Only 200s are cached, so a throttled or failed page is fetched again next run
+session = CachedSession(CACHE_PATH, backend='sqlite', expire_after=CACHE_EXPIRE_SECONDS, allowable_codes=(200,))
+session.headers.update({'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'})
+session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                     max_retries=Retry(total=3, backoff_factor=0.5,
+                                                       status_forcelist=[429, 500, 502, 503, 504])))
@@ -1,33 +1,28 @@
 #!/usr/bin/env python3
 """Test ASA with minimal parameters to see what's filtering the results"""
 
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
 import time
+from openinsider_session import session
 
 ticker = 'ASA'
-headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
+SCREENER_URL = 'http://openinsider.com/screener'
+
+# Compiled once: counts the purchase rows of the results table inside lxml
+COUNT_PURCHASES = etree.XPath('count((//table[@class="tinytable"])[1]//tr[count(td) >= 7][contains(td[7], "P - Purchase")])')
 
 def test_url(name, params):
     print(f"\n{name}")
     print(f"Params: {params}")
     
-    url = 'http://openinsider.com/screener'
-    resp = requests.get(url, params=params, headers=headers, timeout=30)
+    resp = session.get(SCREENER_URL, params=params, timeout=30)
     print(f"URL: {resp.url[:150]}...")
     
-    soup = BeautifulSoup(resp.content, 'html.parser')
-    table = soup.find('table', {'class': 'tinytable'})
-    purchases = 0
-    if table:
-        rows = table.find_all('tr')[1:]
-        for row in rows:
-            cols = row.find_all('td')
-            if len(cols) >= 7 and 'P - Purchase' in cols[6].text:
-                purchases += 1
+    purchases = int(COUNT_PURCHASES(html.fromstring(resp.content)))
     
     print(f"Purchases found: {purchases}")
-    time.sleep(0.5)
+    if not resp.from_cache:
+        time.sleep(0.5)
     return purchases
 
 # Test 1: Minimal parameters
@@ -1,33 +1,23 @@
 #!/usr/bin/env python3
 """Quick test of ASA ticker with both URLs"""
 
-import requests
-from bs4 import BeautifulSoup
-import time
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree, html
+from openinsider_session import session
 
 ticker = 'ASA'
-headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
 
-# Simple URL
-print(f"Testing {ticker} with SIMPLE URL...")
-simple_url = f'http://openinsider.com/search?q={ticker}'
-resp = requests.get(simple_url, headers=headers, timeout=30)
-soup = BeautifulSoup(resp.content, 'html.parser')
-table = soup.find('table', {'class': 'tinytable'})
-simple_purchases = 0
-if table:
-    rows = table.find_all('tr')[1:]
-    for row in rows:
-        cols = row.find_all('td')
-        if len(cols) >= 7 and 'P - Purchase' in cols[6].text:
-            simple_purchases += 1
+# Compiled once: counts the purchase rows of the results table inside lxml
+COUNT_PURCHASES = etree.XPath('count((//table[@class="tinytable"])[1]//tr[count(td) >= 7][contains(td[7], "P - Purchase")])')
+
 
-print(f"Simple URL purchases: {simple_purchases}")
+def count_purchases(url, params=None):
+    """Fetch an openinsider page and count 'P - Purchase' rows in its results table"""
+    resp = session.get(url, params=params, timeout=30)
+    return int(COUNT_PURCHASES(html.fromstring(resp.content))), resp.url
 
-time.sleep(1)
 
-# Extended URL
-print(f"\nTesting {ticker} with EXTENDED URL (no xs parameter)...")
+simple_url = f'http://openinsider.com/search?q={ticker}'
 extended_url = 'http://openinsider.com/screener'
 params = {
     's': ticker,
@@ -45,21 +35,23 @@ params = {
     'oc2l': '', 'oc2h': '', 'sortcol': '0'
 }
 
-print(f"URL: {extended_url}")
-print(f"Params: {params}")
-
-resp = requests.get(extended_url, params=params, headers=headers, timeout=30)
-print(f"Final URL: {resp.url}")
-
-soup = BeautifulSoup(resp.content, 'html.parser')
-table = soup.find('table', {'class': 'tinytable'})
-extended_purchases = 0
-if table:
-    rows = table.find_all('tr')[1:]
-    for row in rows:
-        cols = row.find_all('td')
-        if len(cols) >= 7 and 'P - Purchase' in cols[6].text:
-            extended_purchases += 1
+# Both requests are independent - issue them together so total wait is the slower one, not the sum
+with ThreadPoolExecutor(max_workers=2) as executor:
+    simple_future = executor.submit(count_purchases, simple_url)
+    extended_future = executor.submit(count_purchases, extended_url, params)
+    
+    # Simple URL
+    print(f"Testing {ticker} with SIMPLE URL...")
+    simple_purchases, _ = simple_future.result()
+    print(f"Simple URL purchases: {simple_purchases}")
+    
+    # Extended URL
+    print(f"\nTesting {ticker} with EXTENDED URL (no xs parameter)...")
+    print(f"URL: {extended_url}")
+    print(f"Params: {params}")
+    
+    extended_purchases, final_url = extended_future.result()
+    print(f"Final URL: {final_url}")
+    print(f"Extended URL purchases: {extended_purchases}")
 
-print(f"Extended URL purchases: {extended_purchases}")
 print(f"\nDifference: {extended_purchases - simple_purchases}")
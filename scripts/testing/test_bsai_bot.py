@@ -166,12 +166,15 @@ def test_bsai():
             print("📈 Tracking position...")
             shares = position / entry_price
             
-            events_from_entry = [e for e in events if e['start_date'] >= entry_date]
+            # Events are sorted by start date - binary search the first one on/after entry
+            # and slice out only the 15 shown, instead of filtering every event
+            first_from_entry = detector.event_intervals.left.searchsorted(entry_date, side='left')
+            events_from_entry = events[first_from_entry:first_from_entry + 15]
             
             had_massive_rise = False
             last_rise = None
             
-            for i, event in enumerate(events_from_entry[:15]):  # Show first 15
+            for i, event in enumerate(events_from_entry):  # Show first 15
                 marker = ""
                 
                 if event['type'] == 'RISE':
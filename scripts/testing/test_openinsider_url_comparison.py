@@ -7,49 +7,39 @@ Test script to compare OpenInsider URL approaches:
 Goal: Determine which approach provides more insider trading data
 """
 
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from collections import defaultdict
+from openinsider_session import session
+
+MAX_WORKERS = 4  # Tickers probed concurrently - kept low so openinsider doesn't rate limit us
+
+# Compiled once: the results table, then the trade date cell of every purchase row in it.
+# Row matching runs inside lxml; header cells are <th>, so the 8+ <td> test skips the header row
+TINYTABLE = etree.XPath('//table[@class="tinytable"]')
+PURCHASE_TRADE_DATES = etree.XPath('.//tr[count(td) >= 8][contains(td[7], "P - Purchase")]/td[3]')
 
 
 def fetch_simple_url(ticker):
     """Fetch using the simple search URL (current approach)"""
     url = f"http://openinsider.com/search?q={ticker}"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
     
     try:
-        time.sleep(0.5)  # Rate limiting
-        response = requests.get(url, headers=headers, timeout=30)
+        response = session.get(url, timeout=30)
+        if not response.from_cache:
+            time.sleep(0.5)  # Rate limiting - only pages that actually went to openinsider count
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'class': 'tinytable'})
+        tables = TINYTABLE(html.fromstring(response.content))
         
-        if not table:
+        if not tables:
             return {'success': False, 'trades': 0, 'date_range': None}
         
-        rows = table.find_all('tr')[1:]  # Skip header
-        trades = []
-        
-        for row in rows:
-            cols = row.find_all('td')
-            if len(cols) < 8:
-                continue
-            
-            try:
-                trade_date_str = cols[2].text.strip()
-                trade_type = cols[6].text.strip()
-                
-                # Only count purchases
-                if 'P - Purchase' in trade_type:
-                    trades.append(trade_date_str)
-            except:
-                continue
+        # Only count purchases
+        trades = [cell.text_content().strip() for cell in PURCHASE_TRADE_DATES(tables[0])]
         
         date_range = None
         if trades:
@@ -86,38 +76,19 @@ def fetch_extended_url(ticker, days_back=1461):
         'page': '1'
     }
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
-    
     try:
-        time.sleep(0.5)  # Rate limiting
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = session.get(url, params=params, timeout=30)
+        if not response.from_cache:
+            time.sleep(0.5)  # Rate limiting - only pages that actually went to openinsider count
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'class': 'tinytable'})
+        tables = TINYTABLE(html.fromstring(response.content))
         
-        if not table:
+        if not tables:
             return {'success': False, 'trades': 0, 'date_range': None}
         
-        rows = table.find_all('tr')[1:]  # Skip header
-        trades = []
-        
-        for row in rows:
-            cols = row.find_all('td')
-            if len(cols) < 8:
-                continue
-            
-            try:
-                trade_date_str = cols[2].text.strip()
-                trade_type = cols[6].text.strip()
-                
-                # Only count purchases
-                if 'P - Purchase' in trade_type:
-                    trades.append(trade_date_str)
-            except:
-                continue
+        # Only count purchases
+        trades = [cell.text_content().strip() for cell in PURCHASE_TRADE_DATES(tables[0])]
         
         date_range = None
         if trades:
@@ -136,6 +107,11 @@ def fetch_extended_url(ticker, days_back=1461):
         return {'success': False, 'error': str(e), 'trades': 0}
 
 
+def probe_ticker(ticker):
+    """Fetch a ticker with both URL variants: (simple_result, extended_result)"""
+    return fetch_simple_url(ticker), fetch_extended_url(ticker)
+
+
 def run_comparison_test():
     """Run comparison test on top monthly stocks"""
     
@@ -161,41 +137,39 @@ def run_comparison_test():
     
     comparison_data = []
     
-    for i, ticker in enumerate(tickers, 1):
-        print(f"[{i}/{total_tickers}] Testing {ticker}...", end=' ')
-        
-        # Test simple URL
-        simple_result = fetch_simple_url(ticker)
-        
-        # Test extended URL
-        extended_result = fetch_extended_url(ticker)
-        
-        # Record results
-        if simple_result['success']:
-            results['simple']['success'] += 1
-            results['simple']['total_trades'] += simple_result['trades']
-        else:
-            results['simple']['failed'] += 1
-        
-        if extended_result['success']:
-            results['extended']['success'] += 1
-            results['extended']['total_trades'] += extended_result['trades']
-        else:
-            results['extended']['failed'] += 1
-        
-        # Compare
-        diff = extended_result['trades'] - simple_result['trades']
-        comparison_data.append({
-            'ticker': ticker,
-            'simple_trades': simple_result['trades'],
-            'extended_trades': extended_result['trades'],
-            'difference': diff,
-            'simple_date_range': simple_result.get('date_range'),
-            'extended_date_range': extended_result.get('date_range')
-        })
-        
-        status = "✓" if diff >= 0 else "⚠"
-        print(f"{status} Simple: {simple_result['trades']} | Extended: {extended_result['trades']} | Diff: {diff:+d}")
+    # Probe a few tickers at once over the shared session. Live requests sleep after they return and cached
+    # ones skip the rate-limit sleep; the waits overlap, and map() yields in ticker order, so the report reads the same
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        probes = executor.map(probe_ticker, tickers)
+        for i, (ticker, (simple_result, extended_result)) in enumerate(zip(tickers, probes), 1):
+            print(f"[{i}/{total_tickers}] Testing {ticker}...", end=' ')
+            
+            # Record results
+            if simple_result['success']:
+                results['simple']['success'] += 1
+                results['simple']['total_trades'] += simple_result['trades']
+            else:
+                results['simple']['failed'] += 1
+            
+            if extended_result['success']:
+                results['extended']['success'] += 1
+                results['extended']['total_trades'] += extended_result['trades']
+            else:
+                results['extended']['failed'] += 1
+            
+            # Compare
+            diff = extended_result['trades'] - simple_result['trades']
+            comparison_data.append({
+                'ticker': ticker,
+                'simple_trades': simple_result['trades'],
+                'extended_trades': extended_result['trades'],
+                'difference': diff,
+                'simple_date_range': simple_result.get('date_range'),
+                'extended_date_range': extended_result.get('date_range')
+            })
+            
+            status = "✓" if diff >= 0 else "⚠"
+            print(f"{status} Simple: {simple_result['trades']} | Extended: {extended_result['trades']} | Diff: {diff:+d}")
     
     # Print summary
     print(f"\n{'='*80}")
@@ -1,16 +1,20 @@
 #!/usr/bin/env python3
-import json
+import ijson
+from paths import INSIDER_TRADES_FILE, NaNToNullReader, load_json, open_full_cache
 
-# Check the full cache
-with open('/Users/sagiv.oron/Documents/scripts_playground/stocks/output CSVs/yfinance_cache_full.json', 'r') as f:
-    full_cache = json.load(f)
+# Check the full cache - stream the data mapping one stock at a time instead of loading it all
+cached_tickers = 0
+samples = {}
+with open_full_cache() as f:
+    for ticker, stock in ijson.kvitems(NaNToNullReader(f), 'data'):
+        cached_tickers += 1
+        if len(samples) < 5:
+            samples[ticker] = (len(stock['dates']), stock['dates'][0], stock['dates'][-1])
 
 # Check insider trades
-with open('/Users/sagiv.oron/Documents/scripts_playground/stocks/output CSVs/expanded_insider_trades.json', 'r') as f:
-    insider_data = json.load(f)
+insider_data = load_json(INSIDER_TRADES_FILE)
 
 total_insider_tickers = len(insider_data['data'])
-cached_tickers = len(full_cache['data'])
 missing = total_insider_tickers - cached_tickers
 
 print('📊 CACHE STATUS:')
@@ -23,11 +27,9 @@ print(f'Progress: {(cached_tickers/total_insider_tickers)*100:.1f}% complete')
 print()
 
 # Sample a few stocks to verify data quality
-sample_tickers = list(full_cache['data'].keys())[:5]
 print('Sample stocks (verifying full lifespan data):')
-for ticker in sample_tickers:
-    stock = full_cache['data'][ticker]
-    print(f'  {ticker}: {len(stock["dates"])} days ({stock["dates"][0]} to {stock["dates"][-1]})')
+for ticker, (num_days, first_date, last_date) in samples.items():
+    print(f'  {ticker}: {num_days} days ({first_date} to {last_date})')
 
 print()
 if missing > 0:
@@ -1,55 +1,73 @@
 #!/usr/bin/env python3
 """Check data coverage between insider trades and yfinance cache."""
 
-import json
+import ijson
 from datetime import datetime
+from functools import lru_cache
+from paths import INSIDER_TRADES_FILE, NaNToNullReader, load_json, open_full_cache
+
+
+@lru_cache(maxsize=None)
+def iso_date(date_str):
+    """date_str as a YYYY-MM-DD string, or None if it isn't a valid %Y-%m-%d date. Trade dates repeat, so parse each once."""
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d').date().isoformat()
+    except (TypeError, ValueError):
+        return None
+
 
 def main():
     # Load insider trades
-    with open('output CSVs/expanded_insider_trades.json', 'r') as f:
-        insider_json = json.load(f)
-        insider_data = insider_json.get('data', insider_json)  # Handle both formats
+    insider_json = load_json(INSIDER_TRADES_FILE)
+    insider_data = insider_json.get('data', insider_json)  # Handle both formats
 
-    # Load yfinance cache
-    with open('output CSVs/yfinance_cache_full.json', 'r') as f:
-        yfinance_cache = json.load(f)
+    # Stream yfinance cache - keep only each ticker's date span, not the full price arrays
+    with open_full_cache() as f:
+        cache_metadata = next(ijson.items(NaNToNullReader(f), 'metadata'))
+        f.seek(0)
+        date_spans = {}
+        for ticker, stock_data in ijson.kvitems(NaNToNullReader(f), 'data'):
+            dates = stock_data['dates']
+            date_spans[ticker] = (dates[0], dates[-1], len(dates)) if dates else None
 
     print('='*60)
     print('INSIDER TRADES DATA:')
     print('='*60)
     
-    # Count all individual trades across all tickers
-    total_trades = sum(len(stock_entry['trades']) for stock_entry in insider_data)
-    print(f'Total insider trades: {total_trades:,}')
+    # Count trades, tickers and the trade date range in a single pass.
+    # Valid dates are normalised to YYYY-MM-DD, so string comparison is chronological
+    total_trades = 0
+    unique_tickers = set()
+    min_date = max_date = None
+    for stock_entry in insider_data:
+        unique_tickers.add(stock_entry['ticker'])
+        trades = stock_entry['trades']
+        total_trades += len(trades)
+        for trade in trades:
+            date_str = iso_date(trade.get('trade_date', trade.get('transaction_date', '')))
+            if date_str:
+                if min_date is None or date_str < min_date:
+                    min_date = date_str
+                if max_date is None or date_str > max_date:
+                    max_date = date_str
     
-    unique_tickers = set(stock_entry["ticker"] for stock_entry in insider_data)
+    print(f'Total insider trades: {total_trades:,}')
     print(f'Unique tickers with insider trades: {len(unique_tickers):,}')
     
-    # Get date range from all trades
-    all_trade_dates = []
-    for stock_entry in insider_data:
-        for trade in stock_entry['trades']:
-            try:
-                date_str = trade.get('trade_date', trade.get('transaction_date', ''))
-                if date_str:
-                    all_trade_dates.append(datetime.strptime(date_str, '%Y-%m-%d'))
-            except:
-                pass
-    
-    if all_trade_dates:
-        print(f'Date range: {min(all_trade_dates).date()} to {max(all_trade_dates).date()}')
+    if min_date:
+        print(f'Date range: {min_date} to {max_date}')
     print()
 
     print('='*60)
     print('YFINANCE CACHE DATA:')
     print('='*60)
-    print(f'Total stocks with price history: {len(yfinance_cache["data"]):,}')
-    print(f'Cache created: {yfinance_cache["metadata"]["created"]}')
-    print(f'Date range: {yfinance_cache["metadata"]["date_range"]}')
+    print(f'Total stocks with price history: {len(date_spans):,}')
+    print(f'Cache created: {cache_metadata["created"]}')
+    print(f'Date range: {cache_metadata["date_range"]}')
     print()
 
     # Check coverage
-    cached_tickers = set(yfinance_cache['data'].keys())
+    cached_tickers = set(date_spans.keys())
     missing_from_cache = unique_tickers - cached_tickers
 
     print('='*60)
@@ -76,10 +94,9 @@ def main():
     print('='*60)
     sample_tickers = sorted(list(cached_tickers))[:10]
     for ticker in sample_tickers:
-        stock_data = yfinance_cache['data'][ticker]
-        if stock_data['dates']:
-            num_days = len(stock_data['dates'])
-            print(f'{ticker:6} : {stock_data["dates"][0]} to {stock_data["dates"][-1]} ({num_days:,} days)')
+        if date_spans[ticker]:
+            first_date, last_date, num_days = date_spans[ticker]
+            print(f'{ticker:6} : {first_date} to {last_date} ({num_days:,} days)')
         else:
             print(f'{ticker:6} : NO DATA')
 
@@ -1,40 +1,42 @@
 #!/usr/bin/env python3
 """Extract cache data for only the top 25 best and worst performers."""
 
-import json
-import pandas as pd
+import ijson
+import orjson
+from paths import FULL_CACHE_FILE, OUTPUT_DIR, NaNToNullReader, load_json, open_full_cache
+
 
 def main():
     print("Loading insider conviction backtest results...")
-    with open('output CSVs/insider_conviction_all_stocks_results.json', 'r') as f:
-        results = json.load(f)
+    results = load_json(OUTPUT_DIR / 'insider_conviction_all_stocks_results.json')
     
     # Get top 25 best and worst from the JSON
     top_25_best = [stock['ticker'] for stock in results['top_25_best']]
     top_25_worst = [stock['ticker'] for stock in results['top_25_worst']]
     
-    # Combine into single list of unique tickers
-    target_tickers = set(top_25_best + top_25_worst)
+    # Combine into single set of unique tickers
+    target_tickers = set(top_25_best).union(top_25_worst)
     print(f"Target tickers: {len(target_tickers)} unique stocks")
-    print(f"Tickers: {sorted(target_tickers)}")
+    if len(target_tickers) <= 100:
+        print(f"Tickers: {sorted(target_tickers)}")
     
-    print("\nLoading full cache (this may take a moment)...")
-    with open('output CSVs/yfinance_cache_full.json', 'r') as f:
-        full_cache = json.load(f)
+    print("\nStreaming full cache (this may take a moment)...")
+    # Only the target tickers are kept; every other stock is parsed and dropped immediately
+    filtered_data = {}
+    total_stocks = 0
+    with open_full_cache() as f:
+        cache_metadata = next(ijson.items(NaNToNullReader(f), 'metadata'))
+        f.seek(0)
+        for ticker, stock in ijson.kvitems(NaNToNullReader(f), 'data', use_float=True):
+            total_stocks += 1
+            if ticker in target_tickers:
+                filtered_data[ticker] = stock
     
-    print(f"Full cache has {len(full_cache['data'])} stocks")
+    print(f"Full cache has {total_stocks} stocks")
     
     # Extract only the target tickers
-    filtered_data = {}
-    found = 0
-    missing = []
-    
-    for ticker in target_tickers:
-        if ticker in full_cache['data']:
-            filtered_data[ticker] = full_cache['data'][ticker]
-            found += 1
-        else:
-            missing.append(ticker)
+    found = len(filtered_data)
+    missing = [ticker for ticker in target_tickers if ticker not in filtered_data]
     
     print(f"\nFound {found}/{len(target_tickers)} tickers in cache")
     if missing:
@@ -43,7 +45,7 @@ def main():
     # Create new cache with only top performers
     output = {
         'metadata': {
-            'created': full_cache['metadata']['created'],
+            'created': cache_metadata['created'],
             'total_tickers': len(filtered_data),
             'source': 'extracted from top 25 best and worst performers',
             'date_range': 'entire_lifespan'
@@ -51,35 +53,22 @@ def main():
         'data': filtered_data
     }
     
-    # Save to new file - use allow_nan=False to convert NaN to null
-    output_path = 'output CSVs/yfinance_cache_top_performers.json'
+    # Save to new file - orjson writes NaN/inf as null, so no cleanup pass is needed
+    output_path = OUTPUT_DIR / 'yfinance_cache_top_performers.json'
     print(f"\nSaving to {output_path}...")
     
-    # Convert NaN values to None before saving
-    import math
-    def clean_nan(obj):
-        if isinstance(obj, dict):
-            return {k: clean_nan(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [clean_nan(item) for item in obj]
-        elif isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
-            return None
-        else:
-            return obj
-    
-    output_cleaned = clean_nan(output)
-    
-    with open(output_path, 'w') as f:
-        json.dump(output_cleaned, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(output, option=orjson.OPT_SERIALIZE_NUMPY))  # Compact - this file is read by machines only
     
     print(f"✅ Saved {len(filtered_data)} stocks to {output_path}")
     
-    # Calculate file sizes
+    # Calculate file sizes (against the uncompressed original, when it is still around)
     import os
-    original_size = os.path.getsize('output CSVs/yfinance_cache_full.json') / (1024**2)
-    new_size = os.path.getsize(output_path) / (1024**2)
-    print(f"\nFile size: {new_size:.1f} MB (vs {original_size:.1f} MB original)")
-    print(f"Reduction: {(1 - new_size/original_size)*100:.1f}%")
+    if FULL_CACHE_FILE.exists():
+        original_size = os.path.getsize(FULL_CACHE_FILE) / (1024**2)
+        new_size = os.path.getsize(output_path) / (1024**2)
+        print(f"\nFile size: {new_size:.1f} MB (vs {original_size:.1f} MB original)")
+        print(f"Reduction: {(1 - new_size/original_size)*100:.1f}%")
 
 if __name__ == '__main__':
     main()
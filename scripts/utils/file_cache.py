@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Pickle-backed cache for results derived from a large input file.
+
+Entries are keyed on the source file's path, mtime and size, so they go
+stale automatically when the source is rewritten, and expire after
+max_age_days regardless.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+
+from paths import OUTPUT_DIR
+
+DERIVED_CACHE_DIR = OUTPUT_DIR / 'derived_cache'
+
+
+class FileCache:
+    def __init__(self, cache_dir=DERIVED_CACHE_DIR, max_age_days=30):
+        self.cache_dir = Path(cache_dir)
+        self.max_age_seconds = max_age_days * 24 * 3600
+
+    @staticmethod
+    def key_for(name, source_path):
+        """Cache key for `name` computed from source_path; bump `name` when the computation changes."""
+        st = os.stat(source_path)
+        raw = f'{name}|{Path(source_path).resolve()}|{st.st_mtime_ns}|{st.st_size}'
+        return f'{name}_{hashlib.sha1(raw.encode()).hexdigest()[:16]}'
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, or call compute() and store its result."""
+        path = self.cache_dir / f'{key}.pkl'
+        if path.exists() and time.time() - path.stat().st_mtime < self.max_age_seconds:
+            print(f"📦 Cache hit: {path.name}")
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+
+        print(f"🔄 Cache miss: {path.name}")
+        value = compute()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return value
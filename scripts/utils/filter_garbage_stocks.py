@@ -10,9 +10,11 @@ USAGE:
   .venv/bin/python scripts/utils/filter_garbage_stocks.py
 """
 
-import json
-import yfinance as yf
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from paths import (FILTERED_INSIDER_TRADES_FILE, INSIDER_TRADES_FILE, MAX_WORKERS, YF_INFO_CACHE_FILE, fetch_info,
+                   load_json, save_info_cache)
 
 
 def main():
@@ -22,11 +24,10 @@ def main():
     print()
     
     # Load the full database
-    input_file = 'output CSVs/expanded_insider_trades.json'
+    input_file = INSIDER_TRADES_FILE
     print(f"📂 Loading: {input_file}")
     
-    with open(input_file, 'r') as f:
-        data = json.load(f)
+    data = load_json(input_file)
     
     all_stocks = data.get('data', [])
     total_stocks = len(all_stocks)
@@ -46,19 +47,24 @@ def main():
     print("   Excluding: OTC Pink (PNK) + stocks with < 10K avg daily volume")
     print()
     
-    for i, stock in enumerate(all_stocks):
-        ticker = stock.get('ticker', '')
-        
-        # Progress indicator
-        if (i + 1) % 100 == 0:
-            print(f"   Progress: {i+1}/{total_stocks} ({excluded_count} excluded so far)")
-        
-        try:
-            # Fetch exchange and volume info
-            yf_stock = yf.Ticker(ticker)
-            info = yf_stock.info
-            exchange = info.get('exchange', '')
-            avg_volume = info.get('averageVolume', 0)
+    # Fetch exchange and volume info in parallel (map keeps the original stock order)
+    info_cache = {}
+    fetched_at = datetime.now().isoformat()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        tickers = (stock.get('ticker', '') for stock in all_stocks)
+        for i, (stock, info) in enumerate(zip(all_stocks, executor.map(fetch_info, tickers))):
+            # Progress indicator
+            if (i + 1) % 100 == 0:
+                print(f"   Progress: {i+1}/{total_stocks} ({excluded_count} excluded so far)")
+            
+            if info is None:
+                # If we can't get info, exclude to be safe
+                excluded_count += 1
+                excluded_reasons['api_error'] += 1
+                continue
+            
+            exchange, avg_volume = info
+            info_cache[stock.get('ticker', '')] = {'exchange': exchange, 'averageVolume': avg_volume, 'fetched': fetched_at}
             
             # Filter criteria
             if exchange == 'PNK':
@@ -66,6 +72,12 @@ def main():
                 excluded_reasons['PNK'] += 1
                 continue
             
+            # Yahoo sometimes reports no volume at all - count it as an API error, not as low volume
+            if avg_volume is None:
+                excluded_count += 1
+                excluded_reasons['api_error'] += 1
+                continue
+            
             if avg_volume < 10000:
                 excluded_count += 1
                 excluded_reasons['low_volume'] += 1
@@ -73,12 +85,6 @@ def main():
             
             # Stock passed filters
             filtered_stocks.append(stock)
-            
-        except Exception as e:
-            # If we can't get info, exclude to be safe
-            excluded_count += 1
-            excluded_reasons['api_error'] += 1
-            continue
     
     print()
     print("=" * 80)
@@ -95,7 +101,7 @@ def main():
     print()
     
     # Save filtered database
-    output_file = 'output CSVs/expanded_insider_trades_filtered.json'
+    output_file = FILTERED_INSIDER_TRADES_FILE
     filtered_data = {
         'data': filtered_stocks,
         'metadata': {
@@ -108,10 +114,14 @@ def main():
         }
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(filtered_data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(filtered_data, option=orjson.OPT_SERIALIZE_NUMPY))  # Compact - loaded by every backtest
     
     print(f"💾 Saved filtered database: {output_file}")
+    
+    # Keep the exchange/volume lookups so relax_volume_filter.py can skip re-fetching them
+    save_info_cache(info_cache)
+    print(f"💾 Saved yfinance info cache: {YF_INFO_CACHE_FILE}")
     print()
     print("✅ Done! Update the backtest script to use the filtered database.")
 
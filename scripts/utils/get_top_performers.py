@@ -1,17 +1,33 @@
 #!/usr/bin/env python3
 """Get top 25 best and worst performers from backtest results."""
 
-import pandas as pd
+import csv
+import heapq
+import json
+
+FLOAT_FIELDS = ('return_pct', 'entry_price', 'exit_price', 'peak_gain')
+OUTPUT_FIELDS = ['ticker', 'reputation_category', 'return_pct', 'entry_price',
+                 'exit_price', 'days_held', 'peak_gain', 'exit_reason']
+
+def load_results(path):
+    """Read backtest results rows with numeric fields converted (stdlib csv, no pandas import needed)"""
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        for field in FLOAT_FIELDS:
+            row[field] = float(row[field])
+        row['days_held'] = int(float(row['days_held']))
+    return rows
 
 def main():
     # Load backtest results
-    df = pd.read_csv('output CSVs/backtest_reputation_results.csv')
+    rows = load_results('output CSVs/backtest_reputation_results.csv')
     
     print("=" * 80)
     print("TOP 25 BEST PERFORMERS")
     print("=" * 80)
-    top_25 = df.nlargest(25, 'return_pct')
-    for idx, row in top_25.iterrows():
+    top_25 = heapq.nlargest(25, rows, key=lambda r: r['return_pct'])
+    for row in top_25:
         print(f"{row['ticker']:6} [{row['reputation_category']:9}] | ROI: {row['return_pct']:>7.2f}% | "
               f"${row['entry_price']:.2f} → ${row['exit_price']:.2f} | "
               f"{int(row['days_held'])} days | Peak: {row['peak_gain']:.1f}%")
@@ -19,19 +35,16 @@ def main():
     print("\n" + "=" * 80)
     print("TOP 25 WORST PERFORMERS")
     print("=" * 80)
-    bottom_25 = df.nsmallest(25, 'return_pct')
-    for idx, row in bottom_25.iterrows():
+    bottom_25 = heapq.nsmallest(25, rows, key=lambda r: r['return_pct'])
+    for row in bottom_25:
         print(f"{row['ticker']:6} [{row['reputation_category']:9}] | ROI: {row['return_pct']:>7.2f}% | "
               f"${row['entry_price']:.2f} → ${row['exit_price']:.2f} | "
               f"{int(row['days_held'])} days | Peak: {row['peak_gain']:.1f}%")
     
     # Save to JSON for webapp
-    import json
     output = {
-        'best_performers': top_25[['ticker', 'reputation_category', 'return_pct', 'entry_price', 
-                                     'exit_price', 'days_held', 'peak_gain', 'exit_reason']].to_dict('records'),
-        'worst_performers': bottom_25[['ticker', 'reputation_category', 'return_pct', 'entry_price', 
-                                        'exit_price', 'days_held', 'peak_gain', 'exit_reason']].to_dict('records')
+        'best_performers': [{k: row[k] for k in OUTPUT_FIELDS} for row in top_25],
+        'worst_performers': [{k: row[k] for k in OUTPUT_FIELDS} for row in bottom_25]
     }
     
     with open('output CSVs/top_performers.json', 'w') as f:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Shared project paths, JSON loaders and the yfinance info lookup for the scripts in scripts/utils.
+
+Scripts here are run directly (python scripts/utils/<script>.py), so this
+module is importable as a sibling: `from paths import OUTPUT_DIR, load_json`.
+"""
+
+import gzip
+import mmap
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+
+# Project root - defaults to this checkout, override with STOCKS_ROOT
+ROOT = Path(os.environ.get('STOCKS_ROOT', Path(__file__).resolve().parents[2]))
+OUTPUT_DIR = ROOT / 'output CSVs'
+
+INSIDER_TRADES_FILE = OUTPUT_DIR / 'expanded_insider_trades.json'
+FILTERED_INSIDER_TRADES_FILE = OUTPUT_DIR / 'expanded_insider_trades_filtered.json'
+MONTHLY_TOP_FILE = OUTPUT_DIR / 'top_monthly_insider_trades.json'
+FULL_CACHE_FILE = OUTPUT_DIR / 'yfinance_cache_full.json'
+FULL_CACHE_GZ_FILE = OUTPUT_DIR / 'yfinance_cache_full.json.gz'  # Written alongside by the fetch_yfinance_cache*.py scripts
+YF_INFO_CACHE_FILE = OUTPUT_DIR / 'yf_info_cache.json'
+
+MAX_WORKERS = 16  # Parallel threads for yfinance info requests
+MAX_RETRIES = 3
+
+
+@lru_cache(maxsize=None)
+def load_json(path):
+    """Parse a JSON file with orjson, once per process. Treat the result as read-only."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def fetch_info(ticker):
+    """Fetch (exchange, avg_volume) for a ticker, retrying with backoff; None if every attempt fails.
+    avg_volume is 0 when Yahoo leaves averageVolume out (low volume) and None when it reports null (API error)."""
+    import yfinance as yf  # Only the filter scripts need it - keep it off every other import of this module
+    for attempt in range(MAX_RETRIES):
+        try:
+            info = yf.Ticker(ticker).info
+            return info.get('exchange', ''), info.get('averageVolume', 0)
+        except Exception:
+            if attempt < MAX_RETRIES - 1:
+                time.sleep(2 ** attempt)  # Back off in case Yahoo is rate limiting us
+    return None
+
+
+def load_info_cache():
+    """The saved yfinance exchange/volume lookups (ticker -> {exchange, averageVolume, fetched}), or {} before the first run."""
+    if not YF_INFO_CACHE_FILE.exists():
+        return {}
+    with open(YF_INFO_CACHE_FILE, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def save_info_cache(info_cache):
+    """Write the yfinance info cache through a temp file, so an interrupted run leaves the previous copy intact."""
+    tmp_path = YF_INFO_CACHE_FILE.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(info_cache))
+    os.replace(tmp_path, YF_INFO_CACHE_FILE)
+
+
+def full_cache_source():
+    """The copy of the price cache to read: the gzip file when it is at least as new as the plain JSON."""
+    if FULL_CACHE_GZ_FILE.exists() and (not FULL_CACHE_FILE.exists()
+                                        or FULL_CACHE_GZ_FILE.stat().st_mtime >= FULL_CACHE_FILE.stat().st_mtime):
+        return FULL_CACHE_GZ_FILE
+    return FULL_CACHE_FILE
+
+
+def write_gz_copy(path):
+    """Write a gzip copy of a freshly saved cache file next to it, as <path>.gz - what open_full_cache reads."""
+    # A fraction of the bytes to pull off disk; level 3 keeps most of the ratio for little CPU
+    with open(path, 'rb') as src, gzip.open(f'{path}.gz', 'wb', compresslevel=3) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+
+
+@contextmanager
+def open_full_cache():
+    """Binary stream over the price cache JSON - decompressed from the gzip copy, else an mmap of the plain file."""
+    source = full_cache_source()
+    if source == FULL_CACHE_GZ_FILE:
+        with gzip.open(source, 'rb') as f:
+            yield f
+    else:
+        # Read through the mapping so repeated runs are served straight from the page cache
+        with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+class NaNToNullReader:
+    """Binary file wrapper that rewrites the bare NaN tokens json.dump emits to null, so ijson can parse them."""
+
+    def __init__(self, f):
+        self.f = f
+        self.pending = b''
+
+    def read(self, size=-1):
+        while True:
+            data = self.f.read(size)
+            chunk = (self.pending + data).replace(b'NaN', b'null')
+            self.pending = b''
+            # Hold back a partial 'NaN' split across reads until the next chunk arrives
+            if data:
+                for tail in (b'Na', b'N'):
+                    if chunk.endswith(tail):
+                        chunk, self.pending = chunk[:-len(tail)], tail
+                        break
+            if chunk or not data:
+                return chunk
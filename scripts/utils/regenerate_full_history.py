@@ -4,57 +4,60 @@ Regenerate full_history_insider_trades.json with ALL 50 tickers
 """
 
 import json
-import subprocess
 import sys
-from pathlib import Path
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+from operator import itemgetter
 from typing import Dict, Any
 
+from paths import MONTHLY_TOP_FILE, OUTPUT_DIR, ROOT, load_json
+sys.path.append(str(ROOT / 'scripts' / 'core'))
+from fetch_insider_trades import fetch_insider_trades
+
 DAYS_BACK = 1825  # 5 years
+PURCHASE_FIELDS = itemgetter('insider_name', 'title', 'date', 'filing_date', 'value', 'shares')
+MAX_WORKERS = 16  # HTTP-bound, so more threads than this just risks openinsider rate limits
 
 def fetch_ticker_history(ticker: str) -> Dict[str, Any]:
     """Fetch full history for one ticker"""
     print(f"Fetching {ticker}...", flush=True)
     
     try:
-        cmd = [
-            sys.executable,
-            "scripts/core/fetch_insider_trades.py",
-            ticker,
-            str(DAYS_BACK)
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        data = fetch_insider_trades(ticker.upper(), DAYS_BACK)
         
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            if data.get('success') and data.get('total_purchases', 0) > 0:
+        if data.get('success'):
+            if data.get('total_purchases', 0) > 0:
                 print(f"✓ {ticker}: {data['total_purchases']} purchases", flush=True)
                 
+                # Build trades and collect insiders in one pass (purchases arrive sorted by date)
+                trades = []
+                insiders = set()
+                for p in data['purchases']:
+                    insider_name, title, trade_date, filing_date, value, shares = PURCHASE_FIELDS(p)
+                    insiders.add(insider_name)
+                    trades.append({
+                        'insider_name': insider_name,
+                        'title': title,
+                        'trade_date': trade_date,
+                        'filing_date': filing_date,
+                        'value': f"+${value:,.0f}",
+                        'qty': f"+{shares:,}"
+                    })
+                
                 # Format to match merged structure
                 return {
                     'ticker': ticker,
                     'company_name': ticker,  # Will be enriched if needed
                     'total_value': data.get('purchase_value', 0),
                     'total_purchases': data['total_purchases'],
-                    'unique_insiders': len(set(p['insider_name'] for p in data['purchases'])),
-                    'trades': [
-                        {
-                            'insider_name': p['insider_name'],
-                            'title': p['title'],
-                            'trade_date': p['date'],
-                            'filing_date': p['filing_date'],
-                            'value': f"+${p['value']:,.0f}",
-                            'qty': f"+{p['shares']:,}"
-                        }
-                        for p in data['purchases']
-                    ]
+                    'unique_insiders': len(insiders),
+                    'trades': trades
                 }
             else:
                 print(f"✗ {ticker}: No purchases", flush=True)
                 return None
         else:
-            print(f"✗ {ticker}: Failed (exit {result.returncode})", flush=True)
+            print(f"✗ {ticker}: Failed ({data.get('error')})", flush=True)
             return None
             
     except Exception as e:
@@ -64,25 +67,29 @@ def fetch_ticker_history(ticker: str) -> Dict[str, Any]:
 
 def main():
     # Load top 50 tickers from monthly file
-    monthly_path = Path("output CSVs/top_monthly_insider_trades.json")
-    with open(monthly_path, 'r') as f:
-        monthly_data = json.load(f)
+    monthly_data = load_json(MONTHLY_TOP_FILE)
     
     tickers = [stock['ticker'] for stock in monthly_data['data'][:50]]
     print(f"Fetching full history for {len(tickers)} tickers...")
-    print(f"Using {cpu_count()} parallel workers\n")
+    workers = min(cpu_count(), MAX_WORKERS)
+    print(f"Using {workers} parallel workers\n")
     
-    # Parallel fetch
-    with Pool(cpu_count()) as pool:
-        results = pool.map(fetch_ticker_history, tickers)
+    # Parallel fetch - threads are enough since each worker just waits on HTTP.
+    # imap_unordered hands out one ticker at a time, so a slow ticker never holds up the rest
+    results = {}
+    with ThreadPool(workers) as pool:
+        for done, stock in enumerate(pool.imap_unordered(fetch_ticker_history, tickers, chunksize=1), 1):
+            if stock is not None:
+                results[stock['ticker']] = stock
+            print(f"  Done: {done}/{len(tickers)}", flush=True)
     
-    # Filter successful results
-    stocks_with_data = [r for r in results if r is not None]
+    # Keep successful results in the monthly ranking order
+    stocks_with_data = [results[t] for t in tickers if t in results]
     
     print(f"\n✓ Successfully fetched {len(stocks_with_data)}/{len(tickers)} tickers")
     
     # Save
-    output_path = Path("output CSVs/full_history_insider_trades.json")
+    output_path = OUTPUT_DIR / 'full_history_insider_trades.json'
     with open(output_path, 'w') as f:
         json.dump(stocks_with_data, f, indent=2)
     
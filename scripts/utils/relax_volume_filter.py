@@ -6,7 +6,13 @@ excluded stocks and add back the ones with volume 10K-100K.
 """
 
 import json
-import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from paths import (FILTERED_INSIDER_TRADES_FILE, INSIDER_TRADES_FILE, MAX_WORKERS, fetch_info, load_info_cache,
+                   load_json, save_info_cache)
+
+INFO_CACHE_MAX_AGE_DAYS = 30
+
 
 print("=" * 80)
 print("RELAXING VOLUME FILTER: 100K → 10K")
@@ -14,12 +20,10 @@ print("=" * 80)
 print()
 
 # Load original database
-with open('output CSVs/expanded_insider_trades.json', 'r') as f:
-    original_data = json.load(f)
+original_data = load_json(INSIDER_TRADES_FILE)
 
 # Load current filtered database (100K threshold)
-with open('output CSVs/expanded_insider_trades_filtered.json', 'r') as f:
-    filtered_data = json.load(f)
+filtered_data = load_json(FILTERED_INSIDER_TRADES_FILE)
 
 original_stocks = {s['ticker']: s for s in original_data['data']}
 filtered_stocks = {s['ticker']: s for s in filtered_data['data']}
@@ -39,28 +43,50 @@ added_back = 0
 still_excluded_pnk = 0
 still_excluded_low_vol = 0
 
-for i, ticker in enumerate(excluded_tickers):
-    if (i + 1) % 50 == 0:
-        print(f"  Progress: {i+1}/{len(excluded_tickers)} ({added_back} added back)")
-    
-    try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        exchange = info.get('exchange', '')
-        avg_volume = info.get('averageVolume', 0)
-        
-        # Still exclude PNK
-        if exchange == 'PNK':
-            still_excluded_pnk += 1
-            continue
+# Reuse exchange/volume info saved by earlier filter runs; only fetch missing or stale tickers
+info_cache = load_info_cache()
+
+cutoff = datetime.now() - timedelta(days=INFO_CACHE_MAX_AGE_DAYS)
+excluded_info = {}
+for ticker in excluded_tickers:
+    entry = info_cache.get(ticker)
+    if entry and datetime.fromisoformat(entry['fetched']) >= cutoff:
+        excluded_info[ticker] = (entry['exchange'], entry['averageVolume'])
+
+to_fetch = sorted(t for t in excluded_tickers if t not in excluded_info)
+print(f"  {len(excluded_info)} from info cache, fetching {len(to_fetch)} from yfinance")
+
+fetched_at = datetime.now().isoformat()
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    for i, (ticker, info) in enumerate(zip(to_fetch, executor.map(fetch_info, to_fetch))):
+        if (i + 1) % 50 == 0:
+            print(f"  Progress: {i+1}/{len(to_fetch)} fetched")
         
-        # Add back if volume >= 10K
-        if avg_volume >= 10000:
-            filtered_stocks[ticker] = original_stocks[ticker]
-            added_back += 1
-        else:
-            still_excluded_low_vol += 1
-    except:
+        excluded_info[ticker] = info
+        if info is not None:
+            info_cache[ticker] = {'exchange': info[0], 'averageVolume': info[1], 'fetched': fetched_at}
+
+if to_fetch:
+    save_info_cache(info_cache)
+
+for ticker in sorted(excluded_tickers):
+    info = excluded_info[ticker]
+    if info is None:
+        still_excluded_low_vol += 1
+        continue
+    
+    exchange, avg_volume = info
+    
+    # Still exclude PNK
+    if exchange == 'PNK':
+        still_excluded_pnk += 1
+        continue
+    
+    # Add back if volume >= 10K
+    if avg_volume is not None and avg_volume >= 10000:
+        filtered_stocks[ticker] = original_stocks[ticker]
+        added_back += 1
+    else:
         still_excluded_low_vol += 1
 
 print()
@@ -86,8 +112,8 @@ updated_data = {
     }
 }
 
-with open('output CSVs/expanded_insider_trades_filtered.json', 'w') as f:
-    json.dump(updated_data, f, indent=2)
+with open(FILTERED_INSIDER_TRADES_FILE, 'w') as f:
+    json.dump(updated_data, f, separators=(',', ':'))  # Compact, same as filter_garbage_stocks.py
 
-print("💾 Updated: output CSVs/expanded_insider_trades_filtered.json")
+print(f"💾 Updated: {FILTERED_INSIDER_TRADES_FILE}")
 print("✅ Done!")
@@ -1,11 +1,25 @@
 #!/usr/bin/env python3
 """Update BLNE data in the results JSON with anti-chasing filter applied"""
-import json
+import os
 from datetime import datetime
 
+import orjson
+
+RESULTS_FILE = 'output CSVs/insider_conviction_all_stocks_results.json'
+
+def update_stock(data, stock_obj, ticker_index):
+    """Replace the all_results entry for stock_obj's ticker (or append it), keeping ticker_index in sync"""
+    i = ticker_index.get(stock_obj['ticker'])
+    if i is None:
+        ticker_index[stock_obj['ticker']] = len(data['all_results'])
+        data['all_results'].append(stock_obj)
+        return False
+    data['all_results'][i] = stock_obj
+    return True
+
 # Load the results file
-with open('output CSVs/insider_conviction_all_stocks_results.json', 'r') as f:
-    data = json.load(f)
+with open(RESULTS_FILE, 'rb') as f:
+    data = orjson.loads(f.read())
 
 # BLNE new data with anti-chasing: Only Nov 25 trade (Sept 8 was blocked)
 blne_updated = {
@@ -43,25 +57,25 @@ blne_updated = {
     ]
 }
 
-# Update BLNE in all_results
-updated = False
+# Update BLNE in all_results - index tickers once so further updates are dict lookups, not list scans
+ticker_index = {}
 for i, stock in enumerate(data['all_results']):
-    if stock['ticker'] == 'BLNE':
-        data['all_results'][i] = blne_updated
-        updated = True
-        print(f"✅ Updated BLNE in all_results")
-        break
+    ticker_index.setdefault(stock['ticker'], i)
 
-if not updated:
-    data['all_results'].append(blne_updated)
+if update_stock(data, blne_updated, ticker_index):
+    print(f"✅ Updated BLNE in all_results")
+else:
     print(f"✅ Added BLNE to all_results")
 
 # Update timestamp
 data['analysis_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-# Save
-with open('output CSVs/insider_conviction_all_stocks_results.json', 'w') as f:
-    json.dump(data, f, indent=2)
+# Save - same 2-space layout as before, encoded by orjson; write a temp file and swap it in
+# so an interrupted save never leaves a truncated results file behind
+tmp_file = RESULTS_FILE + '.tmp'
+with open(tmp_file, 'wb') as f:
+    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+os.replace(tmp_file, RESULTS_FILE)
 
 print(f"💾 Saved updated results")
 print()